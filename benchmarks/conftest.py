@@ -0,0 +1,12 @@
+"""
+Shared fixtures for storage adapter benchmarks.
+"""
+import pytest
+from perceptra_storage import LocalStorageAdapter
+
+
+@pytest.fixture
+def local_adapter(tmp_path):
+    """Create a local storage adapter instance."""
+    config = {'base_path': str(tmp_path), 'create_dirs': True}
+    return LocalStorageAdapter(config)
@@ -0,0 +1,82 @@
+"""
+Benchmarks for local filesystem storage adapter hot paths.
+
+Not collected by the default test run; use:
+    pytest benchmarks --benchmark-only
+
+(pytest-benchmark disables itself under xdist, so don't combine with -n.)
+"""
+import itertools
+from io import BytesIO
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+PAYLOAD_1KB = b'x' * 1024
+PAYLOAD_1MB = b'x' * (1024 * 1024)
+
+
+def _upload_args(payload):
+    """Build a pedantic() setup that hands each round a fresh buffer and key."""
+    counter = itertools.count()
+    
+    def setup():
+        return (BytesIO(payload), f'upload/{next(counter)}.bin'), {}
+    
+    return setup
+
+
+def test_upload_1kb(benchmark, local_adapter):
+    """Benchmark uploading a small file."""
+    benchmark.pedantic(local_adapter.upload_file, setup=_upload_args(PAYLOAD_1KB), rounds=200)
+
+
+def test_upload_1mb(benchmark, local_adapter):
+    """Benchmark uploading a larger file."""
+    benchmark.pedantic(local_adapter.upload_file, setup=_upload_args(PAYLOAD_1MB), rounds=50)
+
+
+def test_upload_with_metadata(benchmark, local_adapter):
+    """Benchmark uploading a file with a metadata sidecar."""
+    setup = _upload_args(PAYLOAD_1KB)
+    
+    def setup_with_metadata():
+        args, _ = setup()
+        return args, {'content_type': 'text/plain', 'metadata': {'author': 'bench'}}
+    
+    benchmark.pedantic(local_adapter.upload_file, setup=setup_with_metadata, rounds=200)
+
+
+@pytest.mark.parametrize("payload", [PAYLOAD_1KB, PAYLOAD_1MB], ids=['1kb', '1mb'])
+def test_download(benchmark, local_adapter, payload):
+    """Benchmark downloading a file into memory."""
+    local_adapter.upload_file(BytesIO(payload), 'download.bin')
+    
+    data = benchmark(local_adapter.download_file, 'download.bin')
+    assert len(data) == len(payload)
+
+
+def test_get_file_metadata(benchmark, local_adapter):
+    """Benchmark reading file metadata including the sidecar."""
+    local_adapter.upload_file(
+        BytesIO(PAYLOAD_1KB), 'meta.bin', content_type='text/plain', metadata={'author': 'bench'}
+    )
+    
+    benchmark(local_adapter.get_file_metadata, 'meta.bin')
+
+
+def test_file_exists(benchmark, local_adapter):
+    """Benchmark checking a file exists."""
+    local_adapter.upload_file(BytesIO(PAYLOAD_1KB), 'exists.bin')
+    
+    assert benchmark(local_adapter.file_exists, 'exists.bin') is True
+
+
+def test_list_files_100(benchmark, local_adapter):
+    """Benchmark listing a directory of 100 files."""
+    for i in range(100):
+        local_adapter.upload_file(BytesIO(PAYLOAD_1KB), f'listing/file{i:03d}.bin')
+    
+    files = benchmark(local_adapter.list_files, 'listing/')
+    assert len(files) == 100
@@ -32,6 +32,7 @@ __license__ = 'MIT'
 # Import main components
 from .base import (
     BaseStorageAdapter,
+    AsyncBaseStorageAdapter,
     StorageObject,
     PresignedUrl,
     StorageError,
@@ -61,6 +62,7 @@ __all__ = [
     
     # Base classes and types
     'BaseStorageAdapter',
+    'AsyncBaseStorageAdapter',
     'StorageObject',
     'PresignedUrl',
     
@@ -39,6 +39,9 @@ from ..base import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum blobs accepted by a single batch delete request
+_DELETE_BATCH_SIZE = 256
+
 
 class AzureStorageAdapter(BaseStorageAdapter):
     """
@@ -211,6 +214,37 @@ class AzureStorageAdapter(BaseStorageAdapter):
         except Exception as e:
             raise StorageOperationError(f"Azure delete failed: {e}")
 
+    def delete_files(self, keys: list[str]) -> Dict[str, bool]:
+        """
+        Delete multiple files from Azure with blob batch requests, 256 keys per request.
+        
+        Missing blobs come back as 404 sub-responses and map to False.
+        """
+        try:
+            keys = list(dict.fromkeys(keys))
+            results = {}
+            
+            for start in range(0, len(keys), _DELETE_BATCH_SIZE):
+                batch = keys[start:start + _DELETE_BATCH_SIZE]
+                responses = self._container_client.delete_blobs(
+                    *batch,
+                    raise_on_any_failure=False
+                )
+                
+                # Sub-responses come back in request order
+                for key, response in zip(batch, responses):
+                    results[key] = response.status_code == 202
+            
+            logger.info(f"Deleted {sum(results.values())} of {len(keys)} Azure files")
+            return results
+            
+        except HttpResponseError as e:
+            if e.status_code == 403:
+                raise StoragePermissionError(f"Permission denied deleting from Azure: {e}")
+            raise StorageOperationError(f"Azure batch delete failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"Azure batch delete failed: {e}")
+
     def file_exists(self, key: str) -> bool:
         """Check if file exists in Azure Blob Storage."""
         try:
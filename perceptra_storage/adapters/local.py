@@ -4,11 +4,24 @@ Local filesystem storage adapter implementation.
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional, BinaryIO, Dict, Any
+import io
 import logging
 import shutil
 import os
 import hashlib
+import json
 import mimetypes
+import stat
+import sys
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
 
 from ..base import (
     BaseStorageAdapter,
@@ -22,6 +35,55 @@ from ..base import (
 
 logger = logging.getLogger(__name__)
 
+# Linux can sendfile() between regular files; elsewhere it needs a socket
+_USE_SENDFILE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+_SENDFILE_CHUNK = 1 << 30
+
+
+def _sendfile(src: BinaryIO, dst: BinaryIO) -> bool:
+    """
+    Copy the rest of src into dst in-kernel with sendfile().
+    
+    Skips the two userland copies of a read/write loop. Returns False,
+    having copied nothing, when src isn't a regular file on disk or the
+    filesystem doesn't support it.
+    """
+    if not (_USE_SENDFILE and isinstance(getattr(src, 'raw', src), io.FileIO)):
+        return False
+    
+    try:
+        in_fd = src.fileno()
+        if not stat.S_ISREG(os.fstat(in_fd).st_mode):
+            return False
+        start = offset = src.tell()
+        out_fd = dst.fileno()
+        dst.flush()
+    except OSError:
+        return False
+    
+    try:
+        while True:
+            sent = os.sendfile(out_fd, in_fd, offset, _SENDFILE_CHUNK)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        if offset == start:
+            return False
+        raise
+    finally:
+        # sendfile() doesn't move src's position; leave it where a read
+        # loop would have
+        src.seek(offset)
+    
+    return True
+
+
+def _copy_fileobj(src: BinaryIO, dst: BinaryIO) -> None:
+    """Copy the rest of src into dst, zero-copy when src is a regular file."""
+    if not _sendfile(src, dst):
+        shutil.copyfileobj(src, dst)
+
 
 class LocalStorageAdapter(BaseStorageAdapter):
     """
@@ -121,7 +183,7 @@ class LocalStorageAdapter(BaseStorageAdapter):
             
             # Write file
             with open(full_path, 'wb') as f:
-                shutil.copyfileobj(file_obj, f)
+                _copy_fileobj(file_obj, f)
             
             # Store metadata in a sidecar file if provided
             if metadata or content_type:
@@ -130,9 +192,7 @@ class LocalStorageAdapter(BaseStorageAdapter):
                 if content_type:
                     meta_data['content_type'] = content_type
                 
-                import json
-                with open(meta_path, 'w') as f:
-                    json.dump(meta_data, f)
+                meta_path.write_bytes(_json_dumps(meta_data))
             
             logger.info(f"Uploaded file to local storage: {full_path}")
             return key
@@ -189,6 +249,34 @@ class LocalStorageAdapter(BaseStorageAdapter):
         except (OSError, PermissionError) as e:
             raise StorageOperationError(f"Local delete failed: {e}")
 
+    def copy_file(self, src_key: str, dst_key: str) -> str:
+        """Copy file within local storage, including its metadata sidecar."""
+        try:
+            src_path = self._get_full_path(src_key)
+            dst_path = self._get_full_path(dst_key)
+            
+            if not src_path.is_file():
+                raise StorageNotFoundError(f"File not found: {src_key}")
+            
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src_path, dst_path)
+            
+            # Keep the copy's metadata in sync with the source
+            src_meta = src_path.with_suffix(src_path.suffix + '.meta')
+            dst_meta = dst_path.with_suffix(dst_path.suffix + '.meta')
+            if src_meta.exists():
+                shutil.copy2(src_meta, dst_meta)
+            elif dst_meta.exists():
+                dst_meta.unlink()
+            
+            logger.info(f"Copied file: {src_key} -> {dst_key}")
+            return dst_key
+            
+        except FileNotFoundError:
+            raise StorageNotFoundError(f"File not found: {src_key}")
+        except (OSError, PermissionError) as e:
+            raise StorageOperationError(f"Local copy failed: {e}")
+
     def file_exists(self, key: str) -> bool:
         """Check if file exists in local storage."""
         try:
@@ -220,11 +308,9 @@ class LocalStorageAdapter(BaseStorageAdapter):
             meta_path = full_path.with_suffix(full_path.suffix + '.meta')
             
             if meta_path.exists():
-                import json
-                with open(meta_path, 'r') as f:
-                    meta_data = json.load(f)
-                    content_type = meta_data.pop('content_type', None)
-                    metadata = meta_data
+                meta_data = _json_loads(meta_path.read_bytes())
+                content_type = meta_data.pop('content_type', None)
+                metadata = meta_data
             
             # Guess content type if not stored
             if not content_type:
@@ -4,13 +4,21 @@ MinIO / S3-compatible storage adapter implementation.
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, BinaryIO, Dict, Any
+import functools
 import logging
+import os
+import time
 from urllib.parse import urlparse
 
 try:
+    import certifi
+    import urllib3
     from minio import Minio
+    from minio.commonconfig import CopySource
+    from minio.deleteobjects import DeleteObject
     from minio.error import S3Error, InvalidResponseError
     from urllib3.exceptions import MaxRetryError
+    from urllib3.util import Retry, Timeout
 except ImportError:
     raise ImportError(
         "minio is required for MinIO adapter. Install with: pip install minio"
@@ -28,6 +36,47 @@ from ..base import (
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses retried by the shared MinIO pool manager
+_RETRY_STATUS_CODES = frozenset([500, 502, 503, 504])
+
+# Reported expiry for unsigned public URLs returned in place of presigned ones
+_PUBLIC_URL_LIFETIME = timedelta(days=3650)
+
+
+class _SharedPoolManager(urllib3.PoolManager):
+    """
+    Pool manager that outlives the MinIO clients sharing it.
+    
+    Minio.__del__ calls clear() on its http_client, which would close the
+    pools of every other adapter using the same manager.
+    """
+    
+    def clear(self) -> None:
+        pass
+
+
+@functools.lru_cache(maxsize=16)
+def _get_http_client(max_retries: int, pool_maxsize: int) -> 'urllib3.PoolManager':
+    """
+    Get a urllib3 pool manager shared by MinIO adapters with the same settings.
+    
+    PoolManager is thread-safe and keeps one connection pool per host, so
+    adapters pointing at different endpoints can safely share an instance.
+    Mirrors the defaults the MinIO client would otherwise build per instance.
+    """
+    timeout = 300
+    return _SharedPoolManager(
+        timeout=Timeout(connect=timeout, read=timeout),
+        maxsize=pool_maxsize,
+        cert_reqs='CERT_REQUIRED',
+        ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+        retries=Retry(
+            total=max_retries,
+            backoff_factor=0.2,
+            status_forcelist=_RETRY_STATUS_CODES
+        )
+    )
+
 
 class MinIOStorageAdapter(BaseStorageAdapter):
     """
@@ -38,6 +87,16 @@ class MinIOStorageAdapter(BaseStorageAdapter):
         - endpoint_url: MinIO endpoint (e.g., 'play.min.io:9000')
         - secure: Whether to use HTTPS (default: True)
         - region: Region name (optional)
+        - max_retries: Retries for failed HTTP requests (default: 5)
+        - max_pool_connections: Connections kept per host (default: 10)
+        - public_base_url: Base URL serving the bucket publicly, e.g. a CDN
+          or custom domain (optional, defaults to '<endpoint>/<bucket_name>')
+        - conn_cache_ttl: Seconds a successful test_connection is reused
+          before the bucket is checked again (default: 60)
+        - prefer_public_url: Return the public URL instead of signing for
+          GET presigned URLs (default: False). Lets CDNs cache responses,
+          but only use it for publicly readable buckets: the URL never
+          expires and grants access to anyone holding it.
     
     Credentials required:
         - access_key: Access key ID
@@ -47,7 +106,12 @@ class MinIOStorageAdapter(BaseStorageAdapter):
     def __init__(self, config: Dict[str, Any], credentials: Optional[Dict[str, Any]] = None):
         """Initialize MinIO storage adapter."""
         super().__init__(config, credentials)
+        self._bucket_name = self.config['bucket_name']
         self._client = None
+        self._endpoint_netloc = None
+        self._secure = True
+        self._public_prefix = None
+        self._last_ok_ts = None
         self._initialize_client()
 
     def _validate_config(self) -> None:
@@ -72,11 +136,17 @@ class MinIOStorageAdapter(BaseStorageAdapter):
             
             secure = self.config.get('secure', True)
             region = self.config.get('region')
+            self._endpoint_netloc = endpoint
+            self._secure = secure
             
             # Build client kwargs
             client_kwargs = {
                 'endpoint': endpoint,
-                'secure': secure
+                'secure': secure,
+                'http_client': _get_http_client(
+                    self.config.get('max_retries', 5),
+                    self.config.get('max_pool_connections', 10)
+                )
             }
             
             if self.credentials:
@@ -87,6 +157,7 @@ class MinIOStorageAdapter(BaseStorageAdapter):
                 client_kwargs['region'] = region
             
             self._client = Minio(**client_kwargs)
+            self._public_prefix = self._build_public_prefix()
             
         except Exception as e:
             logger.error(f"Failed to initialize MinIO client: {e}")
@@ -94,13 +165,19 @@ class MinIOStorageAdapter(BaseStorageAdapter):
 
     def test_connection(self, timeout: int = 10) -> bool:
         """Test MinIO connection by checking bucket access."""
+        # Reuse a recent successful check instead of another round-trip
+        ttl = self.config.get('conn_cache_ttl', 60)
+        if self._last_ok_ts is not None and time.monotonic() - self._last_ok_ts < ttl:
+            return True
+        
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             
             # Check if bucket exists
             if not self._client.bucket_exists(bucket_name):
                 raise StorageConnectionError(f"MinIO bucket '{bucket_name}' does not exist")
             
+            self._last_ok_ts = time.monotonic()
             logger.info(f"Successfully connected to MinIO bucket: {bucket_name}")
             return True
             
@@ -122,7 +199,7 @@ class MinIOStorageAdapter(BaseStorageAdapter):
     ) -> str:
         """Upload file to MinIO."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             
             # Get file size
             file_obj.seek(0, 2)  # Seek to end
@@ -142,16 +219,19 @@ class MinIOStorageAdapter(BaseStorageAdapter):
             return key
             
         except S3Error as e:
+            # Any failure may mean the bucket is gone: force the next test_connection to re-check
+            self._last_ok_ts = None
             if e.code == 'AccessDenied':
                 raise StoragePermissionError(f"Permission denied uploading to MinIO: {key}")
             raise StorageOperationError(f"MinIO upload failed: {e}")
         except Exception as e:
+            self._last_ok_ts = None
             raise StorageOperationError(f"MinIO upload failed: {e}")
 
     def download_file(self, key: str, destination: Optional[Path] = None) -> bytes:
         """Download file from MinIO."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             
             if destination:
                 self._client.fget_object(bucket_name, key, str(destination))
@@ -167,18 +247,21 @@ class MinIOStorageAdapter(BaseStorageAdapter):
                 return data
                 
         except S3Error as e:
+            # Any failure may mean the bucket is gone: force the next test_connection to re-check
+            self._last_ok_ts = None
             if e.code == 'NoSuchKey':
                 raise StorageNotFoundError(f"File not found in MinIO: {key}")
             elif e.code == 'AccessDenied':
                 raise StoragePermissionError(f"Permission denied downloading from MinIO: {key}")
             raise StorageOperationError(f"MinIO download failed: {e}")
         except Exception as e:
+            self._last_ok_ts = None
             raise StorageOperationError(f"MinIO download failed: {e}")
 
     def delete_file(self, key: str) -> bool:
         """Delete file from MinIO."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             
             # Check if file exists first
             if not self.file_exists(key):
@@ -197,10 +280,64 @@ class MinIOStorageAdapter(BaseStorageAdapter):
         except Exception as e:
             raise StorageOperationError(f"MinIO delete failed: {e}")
 
+    def delete_files(self, keys: list[str]) -> Dict[str, bool]:
+        """
+        Delete multiple files from MinIO in bulk.
+        
+        Uses the S3 DeleteObjects API, which removes up to 1000 keys per
+        request instead of one round-trip per key. Missing keys are not
+        reported as errors, so they map to True.
+        """
+        try:
+            bucket_name = self._bucket_name
+            keys = list(dict.fromkeys(keys))
+            results = dict.fromkeys(keys, True)
+            
+            # remove_objects is lazy; requests are only sent as it is consumed
+            for error in self._client.remove_objects(
+                bucket_name,
+                (DeleteObject(key) for key in keys)
+            ):
+                results[error.name] = False
+            
+            logger.info(f"Deleted {sum(results.values())} of {len(keys)} MinIO files")
+            return results
+            
+        except S3Error as e:
+            if e.code == 'AccessDenied':
+                raise StoragePermissionError(f"Permission denied deleting from MinIO: {e}")
+            raise StorageOperationError(f"MinIO batch delete failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"MinIO batch delete failed: {e}")
+
+    def copy_file(self, src_key: str, dst_key: str, src_bucket: Optional[str] = None) -> str:
+        """Copy a MinIO object server-side, optionally from another bucket."""
+        try:
+            bucket_name = self._bucket_name
+            source_bucket = src_bucket or bucket_name
+            
+            self._client.copy_object(
+                bucket_name,
+                dst_key,
+                CopySource(source_bucket, src_key)
+            )
+            
+            logger.info(f"Copied MinIO file: {source_bucket}/{src_key} -> {dst_key}")
+            return dst_key
+            
+        except S3Error as e:
+            if e.code == 'NoSuchKey':
+                raise StorageNotFoundError(f"File not found in MinIO: {src_key}")
+            elif e.code == 'AccessDenied':
+                raise StoragePermissionError(f"Permission denied copying in MinIO: {src_key}")
+            raise StorageOperationError(f"MinIO copy failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"MinIO copy failed: {e}")
+
     def file_exists(self, key: str) -> bool:
         """Check if file exists in MinIO."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             self._client.stat_object(bucket_name, key)
             return True
         except S3Error as e:
@@ -211,7 +348,7 @@ class MinIOStorageAdapter(BaseStorageAdapter):
     def get_file_metadata(self, key: str) -> StorageObject:
         """Get file metadata from MinIO."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             stat = self._client.stat_object(bucket_name, key)
             
             return StorageObject(
@@ -231,7 +368,7 @@ class MinIOStorageAdapter(BaseStorageAdapter):
     def list_files(self, prefix: str = "", max_results: int = 1000) -> list[StorageObject]:
         """List files in MinIO bucket."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             files = []
             
             objects = self._client.list_objects(
@@ -264,8 +401,15 @@ class MinIOStorageAdapter(BaseStorageAdapter):
         method: str = "GET"
     ) -> PresignedUrl:
         """Generate presigned URL for MinIO object."""
+        if self.config.get('prefer_public_url') and method.upper() == 'GET':
+            return PresignedUrl(
+                url=self.get_public_url(key),
+                expires_at=datetime.now(timezone.utc) + _PUBLIC_URL_LIFETIME,
+                method='GET'
+            )
+        
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             
             # Map method to MinIO method
             if method.upper() == 'GET':
@@ -294,12 +438,15 @@ class MinIOStorageAdapter(BaseStorageAdapter):
         except S3Error as e:
             raise StorageOperationError(f"MinIO presigned URL generation failed: {e}")
 
+    def _build_public_prefix(self) -> str:
+        """Build the URL prefix that public object URLs are formed from."""
+        public_base_url = self.config.get('public_base_url')
+        if public_base_url:
+            return f"{public_base_url.rstrip('/')}/"
+        
+        protocol = 'https' if self._secure else 'http'
+        return f"{protocol}://{self._endpoint_netloc}/{self._bucket_name}/"
+
     def get_public_url(self, key: str) -> Optional[str]:
         """Get public URL for MinIO object."""
-        endpoint = self.config['endpoint_url']
-        if '://' not in endpoint:
-            protocol = 'https' if self.config.get('secure', True) else 'http'
-            endpoint = f"{protocol}://{endpoint}"
-        
-        bucket_name = self.config['bucket_name']
-        return f"{endpoint}/{bucket_name}/{key}"
\ No newline at end of file
+        return self._public_prefix + key
@@ -1,13 +1,24 @@
 """
 Amazon S3 storage adapter implementation.
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, BinaryIO, Dict, Any
+from typing import Optional, BinaryIO, Dict, Any, Iterator
+from urllib.parse import quote
+import hashlib
+import hmac
 import logging
+import os
+import re
+import threading
+import time
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.exceptions import ClientError, BotoCoreError, ConnectionError
     from botocore.config import Config
 except ImportError:
@@ -27,6 +38,47 @@ from ..base import (
 
 logger = logging.getLogger(__name__)
 
+# Defaults for managed multipart transfers
+_DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+_DEFAULT_MAX_CONCURRENCY = 10
+_DEFAULT_IO_CHUNKSIZE = 256 * 1024
+_DEFAULT_MAX_IO_QUEUE = 100
+
+# Largest source a single CopyObject request accepts
+_MAX_COPY_OBJECT_SIZE = 5 * 1024 ** 3
+
+# Maximum keys accepted by a single DeleteObjects request
+_DELETE_BATCH_SIZE = 1000
+
+# Parallel HeadObject calls when listing with fetch_metadata
+_DEFAULT_METADATA_CONCURRENCY = 16
+
+# boto3 clients are thread-safe but slow to build, so adapters with the same
+# client settings share one (and its connection pool). Bounded LRU.
+_CLIENT_CACHE_SIZE = 32
+_CLIENT_CACHE: 'OrderedDict[tuple, Any]' = OrderedDict()
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Presigned URLs are reused for at most this long, and never for more than
+# a tenth of their lifetime, so callers always get most of what they asked for
+_DEFAULT_PRESIGN_CACHE_SIZE = 4096
+_DEFAULT_PRESIGN_CACHE_TTL = 60
+
+# Bound on cached file_exists answers when exists_cache_ttl is set
+_EXISTS_CACHE_SIZE = 4096
+
+# Buckets botocore presigns as https://<bucket>.s3.amazonaws.com in every region
+_VIRTUAL_HOSTABLE_BUCKET = re.compile(r'^[a-z0-9][a-z0-9-]{1,61}[a-z0-9]$')
+
+
+def _credentials_fingerprint(credentials: Dict[str, Any]) -> str:
+    """Hash credentials so client cache keys never hold secrets in plain text."""
+    digest = hashlib.sha256()
+    for field in ('access_key_id', 'secret_access_key', 'session_token'):
+        digest.update((credentials.get(field) or '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
 
 class S3StorageAdapter(BaseStorageAdapter):
     """
@@ -35,6 +87,30 @@ class S3StorageAdapter(BaseStorageAdapter):
     Configuration required:
         - bucket_name: S3 bucket name
         - region: AWS region (optional, defaults to us-east-1)
+        - s3_multipart_threshold: Size in bytes above which transfers use
+          multipart (optional, defaults to 8 MiB)
+        - s3_multipart_chunksize: Part size in bytes (optional, defaults to 8 MiB)
+        - s3_max_concurrency: Parallel part transfers (optional, defaults to 10)
+        - s3_io_chunksize: Read/write chunk size for downloads (optional,
+          defaults to 256 KiB)
+        - s3_max_io_queue: Downloaded chunks buffered ahead of disk writes
+          (optional, defaults to 100)
+        - metadata_concurrency: Parallel HeadObject calls made by
+          list_files(fetch_metadata=True) (optional, defaults to 16)
+        - tcp_keepalive: Keep idle connections alive so later calls skip a
+          new TCP/TLS handshake (optional, defaults to True)
+        - max_pool_connections: Size of the HTTP connection pool (optional,
+          defaults to max(50, 4 * s3_max_concurrency))
+        - presign_cache_size: Presigned URLs kept for reuse; 0 disables the
+          cache (optional, defaults to 4096)
+        - presign_cache_ttl: Seconds a presigned URL may be reused, capped at
+          a tenth of its expiration (optional, defaults to 60)
+        - signature_version: botocore signature version, e.g. 's3v4'
+          (optional). With 's3v4' and static credentials, presigned URLs are
+          signed in-process without going through botocore.
+        - exists_cache_ttl: Seconds to remember file_exists/bulk_exists
+          answers; uploads and deletes through this adapter invalidate them
+          (optional, defaults to 0, disabled)
     
     Credentials required:
         - access_key_id: AWS access key ID
@@ -45,7 +121,16 @@ class S3StorageAdapter(BaseStorageAdapter):
     def __init__(self, config: Dict[str, Any], credentials: Optional[Dict[str, Any]] = None):
         """Initialize S3 storage adapter."""
         super().__init__(config, credentials)
+        self._bucket_name = self.config['bucket_name']
         self._client = None
+        self._transfer_config = None
+        self._public_prefix = None
+        self._presign_locally = False
+        self._presign_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._presign_cache_lock = threading.Lock()
+        self._signing_key: Optional[tuple] = None
+        self._exists_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._exists_cache_lock = threading.Lock()
         self._initialize_client()
 
     def _validate_config(self) -> None:
@@ -61,12 +146,22 @@ class S3StorageAdapter(BaseStorageAdapter):
         try:
             region = self.config.get('region', 'us-east-1')
             
-            # Configure boto3 with timeout and retry settings
+            # Leave headroom for several concurrent multipart transfers so
+            # workers don't queue on the pool or drop pooled connections
+            max_concurrency = self.config.get('s3_max_concurrency', _DEFAULT_MAX_CONCURRENCY)
+            max_pool_connections = self.config.get(
+                'max_pool_connections', max(50, max_concurrency * 4)
+            )
+            
+            # Configure boto3 with timeout, retry and connection reuse settings
             boto_config = Config(
                 region_name=region,
                 connect_timeout=10,
                 read_timeout=30,
-                retries={'max_attempts': 3, 'mode': 'standard'}
+                retries={'max_attempts': 3, 'mode': 'standard'},
+                tcp_keepalive=self.config.get('tcp_keepalive', True),
+                max_pool_connections=max_pool_connections,
+                signature_version=self.config.get('signature_version')
             )
             
             # Build session kwargs
@@ -78,7 +173,43 @@ class S3StorageAdapter(BaseStorageAdapter):
                 if 'session_token' in self.credentials:
                     session_kwargs['aws_session_token'] = self.credentials['session_token']
             
-            self._client = boto3.client('s3', config=boto_config, **session_kwargs)
+            cache_key = (
+                region,
+                boto_config.tcp_keepalive,
+                max_pool_connections,
+                boto_config.signature_version,
+                _credentials_fingerprint(self.credentials)
+            )
+            with _CLIENT_CACHE_LOCK:
+                client = _CLIENT_CACHE.get(cache_key)
+                if client is None:
+                    client = boto3.client('s3', config=boto_config, **session_kwargs)
+                    _CLIENT_CACHE[cache_key] = client
+                    if len(_CLIENT_CACHE) > _CLIENT_CACHE_SIZE:
+                        _CLIENT_CACHE.popitem(last=False)
+                else:
+                    _CLIENT_CACHE.move_to_end(cache_key)
+            self._client = client
+            
+            # Built once so every managed transfer shares the same settings
+            chunksize = self.config.get('s3_multipart_chunksize', _DEFAULT_MULTIPART_CHUNKSIZE)
+            self._transfer_config = TransferConfig(
+                multipart_threshold=self.config.get('s3_multipart_threshold', chunksize),
+                multipart_chunksize=chunksize,
+                max_concurrency=max_concurrency,
+                io_chunksize=self.config.get('s3_io_chunksize', _DEFAULT_IO_CHUNKSIZE),
+                max_io_queue=self.config.get('s3_max_io_queue', _DEFAULT_MAX_IO_QUEUE),
+                use_threads=True
+            )
+            
+            # get_public_url is a hot path for serving assets; only the key varies
+            if region == 'us-east-1':
+                self._public_prefix = f"https://{self._bucket_name}.s3.amazonaws.com/"
+            else:
+                self._public_prefix = f"https://{self._bucket_name}.s3.{region}.amazonaws.com/"
+            
+            # Fixed by the settings above, so decided once rather than per presign
+            self._presign_locally = self._can_presign_locally()
             
         except Exception as e:
             logger.error(f"Failed to initialize S3 client: {e}")
@@ -87,7 +218,7 @@ class S3StorageAdapter(BaseStorageAdapter):
     def test_connection(self, timeout: int = 10) -> bool:
         """Test S3 connection by checking bucket access."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             
             # Try to head the bucket to verify access
             self._client.head_bucket(Bucket=bucket_name)
@@ -116,7 +247,7 @@ class S3StorageAdapter(BaseStorageAdapter):
     ) -> str:
         """Upload file to S3."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             extra_args = {}
             
             if content_type:
@@ -129,8 +260,10 @@ class S3StorageAdapter(BaseStorageAdapter):
                 file_obj,
                 bucket_name,
                 key,
-                ExtraArgs=extra_args if extra_args else None
+                ExtraArgs=extra_args if extra_args else None,
+                Config=self._transfer_config
             )
+            self._forget_exists(key)
             
             logger.info(f"Uploaded file to S3: s3://{bucket_name}/{key}")
             return key
@@ -144,24 +277,38 @@ class S3StorageAdapter(BaseStorageAdapter):
             raise StorageOperationError(f"S3 upload failed: {e}")
 
     def download_file(self, key: str, destination: Optional[Path] = None) -> bytes:
-        """Download file from S3."""
+        """
+        Download file from S3.
+        
+        Objects up to the multipart threshold take a single ranged GetObject.
+        Larger ones are handed to the managed transfer, which fetches them as
+        parallel ranged GETs.
+        """
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
+            data = self._get_object_head(key)
+            
+            if data is None:
+                buffer = BytesIO()
+                self._client.download_fileobj(
+                    bucket_name, key, buffer, Config=self._transfer_config
+                )
+                data = buffer.getvalue()
             
             if destination:
-                self._client.download_file(bucket_name, key, str(destination))
+                # Write the in-memory copy out instead of re-reading the file from disk
+                with open(destination, 'wb') as f:
+                    f.write(data)
                 logger.info(f"Downloaded S3 file to: {destination}")
-                with open(destination, 'rb') as f:
-                    return f.read()
             else:
-                response = self._client.get_object(Bucket=bucket_name, Key=key)
-                data = response['Body'].read()
                 logger.info(f"Downloaded S3 file: s3://{bucket_name}/{key}")
-                return data
+            
+            return data
                 
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            if error_code == 'NoSuchKey':
+            # Managed transfers report a missing key from their HeadObject as '404'
+            if error_code in ('NoSuchKey', '404'):
                 raise StorageNotFoundError(f"File not found in S3: {key}")
             elif error_code == '403':
                 raise StoragePermissionError(f"Permission denied downloading from S3: {key}")
@@ -169,21 +316,48 @@ class S3StorageAdapter(BaseStorageAdapter):
         except Exception as e:
             raise StorageOperationError(f"S3 download failed: {e}")
 
+    def _get_object_head(self, key: str) -> Optional[bytes]:
+        """
+        Fetch an object with one GetObject for its first multipart_threshold bytes.
+        
+        Returns the whole body when that covers the object, or None when the
+        object is larger and needs the managed download.
+        """
+        threshold = self._transfer_config.multipart_threshold
+        try:
+            response = self._client.get_object(
+                Bucket=self._bucket_name,
+                Key=key,
+                Range=f"bytes=0-{threshold - 1}"
+            )
+        except ClientError as e:
+            # Any range of an empty object is unsatisfiable
+            if e.response.get('Error', {}).get('Code') == 'InvalidRange':
+                return b''
+            raise
+        
+        body = response['Body'].read()
+        content_range = response.get('ContentRange')
+        if content_range and int(content_range.rsplit('/', 1)[1]) > len(body):
+            return None
+        return body
+
     def delete_file(self, key: str) -> bool:
-        """Delete file from S3."""
+        """
+        Delete file from S3.
+        
+        Issues a single DeleteObject request. S3 deletes are idempotent, so
+        deleting a key that does not exist succeeds instead of raising
+        StorageNotFoundError; probing first would cost an extra round-trip.
+        """
         try:
-            bucket_name = self.config['bucket_name']
-            
-            # Check if file exists first
-            if not self.file_exists(key):
-                raise StorageNotFoundError(f"File not found in S3: {key}")
+            bucket_name = self._bucket_name
             
             self._client.delete_object(Bucket=bucket_name, Key=key)
+            self._forget_exists(key)
             logger.info(f"Deleted S3 file: s3://{bucket_name}/{key}")
             return True
             
-        except StorageNotFoundError:
-            raise
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             if error_code == '403':
@@ -192,22 +366,220 @@ class S3StorageAdapter(BaseStorageAdapter):
         except Exception as e:
             raise StorageOperationError(f"S3 delete failed: {e}")
 
+    def delete_files(self, keys: list[str]) -> Dict[str, bool]:
+        """
+        Delete multiple files from S3 with DeleteObjects, 1000 keys per request.
+        
+        S3 does not report missing keys as errors, so they map to True.
+        """
+        try:
+            bucket_name = self._bucket_name
+            keys = list(dict.fromkeys(keys))
+            results = dict.fromkeys(keys, True)
+            
+            for start in range(0, len(keys), _DELETE_BATCH_SIZE):
+                batch = keys[start:start + _DELETE_BATCH_SIZE]
+                response = self._client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                
+                # Quiet mode only reports the keys that could not be deleted
+                for error in response.get('Errors', []):
+                    results[error['Key']] = False
+                
+                for key in batch:
+                    self._forget_exists(key)
+            
+            logger.info(f"Deleted {sum(results.values())} of {len(keys)} S3 files from {bucket_name}")
+            return results
+            
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code in ('403', 'AccessDenied'):
+                raise StoragePermissionError(f"Permission denied deleting from S3: {e}")
+            raise StorageOperationError(f"S3 batch delete failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"S3 batch delete failed: {e}")
+
+    def copy_file(self, src_key: str, dst_key: str, src_bucket: Optional[str] = None) -> str:
+        """
+        Copy an S3 object server-side, optionally from another bucket.
+        
+        Uses a single CopyObject request; objects over its 5 GB limit fall
+        back to a managed multipart copy (parallel UploadPartCopy). Either
+        way the data stays inside S3.
+        """
+        try:
+            bucket_name = self._bucket_name
+            copy_source = {'Bucket': src_bucket or bucket_name, 'Key': src_key}
+            
+            try:
+                self._client.copy_object(
+                    Bucket=bucket_name,
+                    Key=dst_key,
+                    CopySource=copy_source
+                )
+            except ClientError as e:
+                if not self._exceeds_copy_limit(e, copy_source):
+                    raise
+                self._client.copy(
+                    copy_source, bucket_name, dst_key, Config=self._transfer_config
+                )
+            self._forget_exists(dst_key)
+            
+            logger.info(f"Copied S3 file: s3://{copy_source['Bucket']}/{src_key} -> {dst_key}")
+            return dst_key
+            
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code in ('NoSuchKey', '404'):
+                raise StorageNotFoundError(f"File not found in S3: {src_key}")
+            elif error_code in ('403', 'AccessDenied'):
+                raise StoragePermissionError(f"Permission denied copying in S3: {src_key}")
+            raise StorageOperationError(f"S3 copy failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"S3 copy failed: {e}")
+
+    def _exceeds_copy_limit(self, error: ClientError, copy_source: Dict[str, str]) -> bool:
+        """Tell whether CopyObject failed only because the source is over 5 GB."""
+        error_info = error.response.get('Error', {})
+        # Other InvalidRequest causes (e.g. copying an object onto itself) must surface
+        if error_info.get('Code') != 'InvalidRequest':
+            return False
+        if 'maximum allowable size' in error_info.get('Message', ''):
+            return True
+        
+        try:
+            response = self._client.head_object(**copy_source)
+        except ClientError:
+            return False
+        return response.get('ContentLength', 0) > _MAX_COPY_OBJECT_SIZE
+
     def file_exists(self, key: str) -> bool:
         """Check if file exists in S3."""
+        cached = self._cached_exists(key)
+        if cached is not None:
+            return cached
+        
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             self._client.head_object(Bucket=bucket_name, Key=key)
-            return True
+            exists = True
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            if error_code == '404':
-                return False
-            raise StorageOperationError(f"S3 file_exists check failed: {e}")
+            if error_code != '404':
+                raise StorageOperationError(f"S3 file_exists check failed: {e}")
+            exists = False
+        
+        self._remember_exists(key, exists)
+        return exists
+
+    def bulk_exists(self, keys: list[str]) -> Dict[str, bool]:
+        """
+        Check whether many S3 keys exist using as few requests as possible.
+        
+        Keys in the same "directory" are answered from one ListObjectsV2
+        scan that starts just before the first of them and stops after the
+        last, instead of a HeadObject per key. A scan gives up after
+        len(group) // 2 pages (e.g. in very dense directories) and leaves
+        the keys it didn't reach to HeadObject, as are keys alone in their
+        directory; those run in parallel.
+        """
+        results = {}
+        groups: Dict[str, list] = {}
+        for key in dict.fromkeys(keys):
+            cached = self._cached_exists(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                groups.setdefault(key.rpartition('/')[0], []).append(key)
+        
+        to_head = []
+        try:
+            for group in groups.values():
+                if len(group) == 1:
+                    to_head.extend(group)
+                    continue
+                
+                group.sort()
+                wanted = set(group)
+                request = {'Bucket': self._bucket_name, 'Prefix': os.path.commonprefix(group)}
+                if len(group[0]) > 1:
+                    # A proper prefix of the first key sorts just before it
+                    request['StartAfter'] = group[0][:-1]
+                pages_left = max(1, len(group) // 2)
+                scanned_to = None
+                
+                while True:
+                    page = self._client.list_objects_v2(**request)
+                    pages_left -= 1
+                    contents = page.get('Contents', [])
+                    for obj in contents:
+                        if obj['Key'] in wanted:
+                            results[obj['Key']] = True
+                    
+                    if not page.get('IsTruncated'):
+                        scanned_to = group[-1]
+                        break
+                    if contents:
+                        scanned_to = contents[-1]['Key']
+                    if (scanned_to is not None and scanned_to >= group[-1]) or not pages_left:
+                        break
+                    request['ContinuationToken'] = page['NextContinuationToken']
+                
+                # Listings are sorted, so every key up to scanned_to was seen
+                for key in group:
+                    if scanned_to is not None and key <= scanned_to:
+                        results.setdefault(key, False)
+                        self._remember_exists(key, results[key])
+                    else:
+                        to_head.append(key)
+            
+        except ClientError as e:
+            raise StorageOperationError(f"S3 bulk_exists check failed: {e}")
+        
+        if to_head:
+            max_workers = self.config.get('metadata_concurrency', _DEFAULT_METADATA_CONCURRENCY)
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(to_head))) as executor:
+                results.update(zip(to_head, executor.map(self.file_exists, to_head)))
+        
+        return results
+
+    def _cached_exists(self, key: str) -> Optional[bool]:
+        """Return a still-fresh cached existence answer, if any."""
+        if not self._exists_cache:
+            return None
+        with self._exists_cache_lock:
+            entry = self._exists_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._exists_cache[key]
+                return None
+            return entry[1]
+
+    def _remember_exists(self, key: str, exists: bool) -> None:
+        """Cache an existence answer when exists_cache_ttl is enabled."""
+        ttl = self.config.get('exists_cache_ttl', 0)
+        if ttl <= 0:
+            return
+        with self._exists_cache_lock:
+            self._exists_cache[key] = (time.monotonic() + ttl, exists)
+            self._exists_cache.move_to_end(key)
+            while len(self._exists_cache) > _EXISTS_CACHE_SIZE:
+                self._exists_cache.popitem(last=False)
+
+    def _forget_exists(self, key: str) -> None:
+        """Drop a cached existence answer after the key was written or deleted."""
+        if self._exists_cache:
+            with self._exists_cache_lock:
+                self._exists_cache.pop(key, None)
 
     def get_file_metadata(self, key: str) -> StorageObject:
         """Get file metadata from S3."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             response = self._client.head_object(Bucket=bucket_name, Key=key)
             
             return StorageObject(
@@ -225,37 +597,140 @@ class S3StorageAdapter(BaseStorageAdapter):
                 raise StorageNotFoundError(f"File not found in S3: {key}")
             raise StorageOperationError(f"S3 metadata retrieval failed: {e}")
 
-    def list_files(self, prefix: str = "", max_results: int = 1000) -> list[StorageObject]:
-        """List files in S3 bucket."""
+    def list_files(
+        self,
+        prefix: str = "",
+        max_results: int = 1000,
+        fetch_metadata: bool = False
+    ) -> list[StorageObject]:
+        """
+        List files in S3 bucket.
+        
+        Only the fields returned by ListObjectsV2 are populated by default.
+        Set fetch_metadata to also load content type and user metadata; this
+        costs one HeadObject per file, issued in parallel. Files deleted
+        between the listing and their HeadObject are left out.
+        """
+        files = list(self.iter_files(prefix, max_results))
+        
+        if fetch_metadata and files:
+            max_workers = self.config.get('metadata_concurrency', _DEFAULT_METADATA_CONCURRENCY)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                heads = executor.map(self._get_listed_metadata, [f.key for f in files])
+                files = [head for head in heads if head is not None]
+        
+        logger.info(f"Listed {len(files)} files from S3 with prefix: {prefix}")
+        return files
+
+    def _get_listed_metadata(self, key: str) -> Optional[StorageObject]:
+        """Get metadata for a listed key, or None if it was deleted since."""
         try:
-            bucket_name = self.config['bucket_name']
-            files = []
-            
-            paginator = self._client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=bucket_name,
-                Prefix=prefix,
-                PaginationConfig={'MaxItems': max_results}
-            )
-            
-            for page in page_iterator:
-                if 'Contents' not in page:
-                    continue
-                    
-                for obj in page['Contents']:
-                    files.append(StorageObject(
+            return self.get_file_metadata(key)
+        except StorageNotFoundError:
+            return None
+
+    def iter_files(
+        self,
+        prefix: str = "",
+        max_results: Optional[int] = None
+    ) -> Iterator[StorageObject]:
+        """
+        Lazily iterate over files in S3 bucket.
+        
+        Pages are fetched as the iterator is consumed (one page ahead), so
+        memory stays bounded regardless of how many keys match.
+        """
+        for batch in self.list_files_batches(prefix, max_results):
+            yield from batch
+
+    def list_files_batches(
+        self,
+        prefix: str = "",
+        max_results: Optional[int] = None
+    ) -> Iterator[list[StorageObject]]:
+        """
+        Iterate over files in S3 bucket one listing page at a time.
+        
+        Each batch holds up to 1000 objects, which suits bulk follow-up
+        operations such as delete_files.
+        """
+        try:
+            for contents in self._iter_list_pages(prefix, max_results):
+                yield [
+                    StorageObject(
                         key=obj['Key'],
                         size=obj['Size'],
                         last_modified=obj['LastModified'],
                         etag=obj.get('ETag', '').strip('"')
-                    ))
-            
-            logger.info(f"Listed {len(files)} files from S3 with prefix: {prefix}")
-            return files
+                    )
+                    for obj in contents
+                ]
             
         except ClientError as e:
             raise StorageOperationError(f"S3 list operation failed: {e}")
 
+    def list_files_columnar(self, prefix: str = "", max_results: int = 1000) -> Dict[str, list]:
+        """List files in S3 bucket as columns, without building StorageObjects."""
+        keys, sizes, last_modified, etags = [], [], [], []
+        try:
+            for contents in self._iter_list_pages(prefix, max_results):
+                for obj in contents:
+                    keys.append(obj['Key'])
+                    sizes.append(obj['Size'])
+                    last_modified.append(obj['LastModified'])
+                    etags.append(obj.get('ETag', '').strip('"'))
+        except ClientError as e:
+            raise StorageOperationError(f"S3 list operation failed: {e}")
+        
+        logger.info(f"Listed {len(keys)} files from S3 with prefix: {prefix}")
+        return {'key': keys, 'size': sizes, 'last_modified': last_modified, 'etag': etags}
+
+    def _iter_list_pages(self, prefix: str, max_results: Optional[int]) -> Iterator[list]:
+        """
+        Yield the raw Contents of each ListObjectsV2 page.
+        
+        The first page is fetched inline. Only when the listing is truncated
+        is a worker thread started, so that the request for the next page
+        overlaps with the caller processing the current one.
+        """
+        if max_results is not None and max_results <= 0:
+            return
+        
+        request = {'Bucket': self._bucket_name, 'Prefix': prefix}
+        remaining = max_results
+        executor = None
+        
+        def build(token: Optional[str]) -> dict:
+            kwargs = dict(request)
+            if token:
+                kwargs['ContinuationToken'] = token
+            if remaining is not None:
+                kwargs['MaxKeys'] = min(remaining, 1000)
+            return kwargs
+        
+        try:
+            page = self._client.list_objects_v2(**build(None))
+            while page is not None:
+                contents = page.get('Contents', [])
+                if remaining is not None:
+                    contents = contents[:remaining]
+                    remaining -= len(contents)
+                
+                token = page.get('NextContinuationToken') if page.get('IsTruncated') else None
+                future = None
+                if token and (remaining is None or remaining > 0):
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1)
+                    future = executor.submit(self._client.list_objects_v2, **build(token))
+                
+                if contents:
+                    yield contents
+                page = future.result() if future is not None else None
+        finally:
+            if executor is not None:
+                # Don't block on a prefetch the caller no longer wants
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def generate_presigned_url(
         self,
         key: str,
@@ -264,7 +739,7 @@ class S3StorageAdapter(BaseStorageAdapter):
     ) -> PresignedUrl:
         """Generate presigned URL for S3 object."""
         try:
-            bucket_name = self.config['bucket_name']
+            bucket_name = self._bucket_name
             
             # Map method to S3 operation
             operation_map = {
@@ -273,34 +748,129 @@ class S3StorageAdapter(BaseStorageAdapter):
                 'DELETE': 'delete_object'
             }
             
-            operation = operation_map.get(method.upper())
+            method = method.upper()
+            operation = operation_map.get(method)
             if not operation:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            url = self._client.generate_presigned_url(
-                operation,
-                Params={'Bucket': bucket_name, 'Key': key},
-                ExpiresIn=expiration
+            # Signing is a pure function of its inputs, so hot keys can
+            # reuse a recent URL instead of re-running SigV4
+            cache_size = self.config.get('presign_cache_size', _DEFAULT_PRESIGN_CACHE_SIZE)
+            reuse_for = min(
+                self.config.get('presign_cache_ttl', _DEFAULT_PRESIGN_CACHE_TTL),
+                expiration // 10
             )
+            cache_key = (key, method, expiration)
+            now = time.monotonic()
+            
+            if cache_size > 0 and reuse_for > 0:
+                with self._presign_cache_lock:
+                    cached = self._presign_cache.get(cache_key)
+                    if cached is not None and now - cached[0] < reuse_for:
+                        self._presign_cache.move_to_end(cache_key)
+                        # Fresh instance per call; callers own what they get back
+                        return PresignedUrl(url=cached[1], expires_at=cached[2], method=method)
+            
+            now_utc = datetime.now(timezone.utc)
+            if self._presign_locally:
+                url = self._presign_v4(key, method, expiration, now_utc)
+            else:
+                url = self._client.generate_presigned_url(
+                    operation,
+                    Params={'Bucket': bucket_name, 'Key': key},
+                    ExpiresIn=expiration
+                )
             
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=expiration)
+            expires_at = now_utc + timedelta(seconds=expiration)
             
-            return PresignedUrl(
+            presigned = PresignedUrl(
                 url=url,
                 expires_at=expires_at,
-                method=method.upper()
+                method=method
             )
             
+            if cache_size > 0 and reuse_for > 0:
+                with self._presign_cache_lock:
+                    self._presign_cache[cache_key] = (now, url, expires_at)
+                    self._presign_cache.move_to_end(cache_key)
+                    while len(self._presign_cache) > cache_size:
+                        self._presign_cache.popitem(last=False)
+            
+            return presigned
+            
         except ClientError as e:
             raise StorageOperationError(f"S3 presigned URL generation failed: {e}")
 
-    def get_public_url(self, key: str) -> Optional[str]:
-        """Get public URL for S3 object (if bucket is public)."""
-        bucket_name = self.config['bucket_name']
+    def _can_presign_locally(self) -> bool:
+        """
+        Whether _presign_v4 produces the same URL botocore would.
+        
+        The local signer assumes the stock regional AWS endpoint with
+        virtual-hosted addressing; any endpoint override (AWS_ENDPOINT_URL,
+        FIPS, dualstack) or s3 addressing/accelerate option, whether set in
+        code or the AWS config file, leaves presigning to botocore.
+        """
+        credentials = self.credentials
+        region = self.config.get('region', 'us-east-1')
+        client_meta = self._client.meta
+        return (
+            self.config.get('signature_version') == 's3v4'
+            and bool(credentials.get('access_key_id'))
+            and bool(credentials.get('secret_access_key'))
+            and _VIRTUAL_HOSTABLE_BUCKET.match(self._bucket_name) is not None
+            and client_meta.endpoint_url == f"https://s3.{region}.amazonaws.com"
+            and not client_meta.config.s3
+        )
+
+    def _presign_v4(self, key: str, method: str, expiration: int, now: datetime) -> str:
+        """
+        Build a SigV4 query-string presigned URL without botocore.
+        
+        Presigning needs no network call, and going through botocore's
+        request pipeline costs far more than the few HMACs involved. The
+        derived signing key only changes with the date, so it is cached.
+        """
+        credentials = self.credentials
         region = self.config.get('region', 'us-east-1')
+        amz_date = now.strftime('%Y%m%dT%H%M%SZ')
+        date_stamp = amz_date[:8]
         
-        # Standard S3 URL format
-        if region == 'us-east-1':
-            return f"https://{bucket_name}.s3.amazonaws.com/{key}"
-        else:
-            return f"https://{bucket_name}.s3.{region}.amazonaws.com/{key}"
\ No newline at end of file
+        cached = self._signing_key
+        if cached is None or cached[0] != date_stamp:
+            signing_key = ('AWS4' + credentials['secret_access_key']).encode('utf-8')
+            for part in (date_stamp, region, 's3', 'aws4_request'):
+                signing_key = hmac.new(signing_key, part.encode('utf-8'), hashlib.sha256).digest()
+            cached = self._signing_key = (date_stamp, signing_key)
+        
+        scope = f"{date_stamp}/{region}/s3/aws4_request"
+        params = [
+            ('X-Amz-Algorithm', 'AWS4-HMAC-SHA256'),
+            ('X-Amz-Credential', f"{credentials['access_key_id']}/{scope}"),
+            ('X-Amz-Date', amz_date),
+            ('X-Amz-Expires', str(expiration)),
+            ('X-Amz-SignedHeaders', 'host'),
+        ]
+        if credentials.get('session_token'):
+            params.append(('X-Amz-Security-Token', credentials['session_token']))
+        
+        encoded = [(name, quote(value, safe='-_.~')) for name, value in params]
+        canonical_query = '&'.join(f"{name}={value}" for name, value in sorted(encoded))
+        host = f"{self._bucket_name}.s3.amazonaws.com"
+        path = '/' + quote(key, safe='/~')
+        
+        canonical_request = (
+            f"{method}\n{path}\n{canonical_query}\n"
+            f"host:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        )
+        string_to_sign = (
+            f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+            + hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+        )
+        signature = hmac.new(cached[1], string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+        
+        query = '&'.join(f"{name}={value}" for name, value in encoded)
+        return f"https://{host}{path}?{query}&X-Amz-Signature={signature}"
+
+    def get_public_url(self, key: str) -> Optional[str]:
+        """Get public URL for S3 object (if bucket is public)."""
+        return self._public_prefix + key
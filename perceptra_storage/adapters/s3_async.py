@@ -0,0 +1,341 @@
+"""
+Asynchronous Amazon S3 storage adapter implementation.
+"""
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, BinaryIO, Dict, Any
+import asyncio
+import logging
+
+try:
+    import aioboto3
+    from aiobotocore.config import AioConfig
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError, BotoCoreError
+except ImportError:
+    raise ImportError(
+        "aioboto3 is required for async S3 adapter. Install with: pip install aioboto3"
+    )
+
+from ..base import (
+    AsyncBaseStorageAdapter,
+    StorageObject,
+    PresignedUrl,
+    StorageConnectionError,
+    StorageOperationError,
+    StorageNotFoundError,
+    StoragePermissionError
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncS3StorageAdapter(AsyncBaseStorageAdapter):
+    """
+    Asynchronous Amazon S3 storage adapter built on aioboto3.
+
+    Suited to workloads with many small objects in flight under asyncio,
+    where the sync adapter would need a thread per concurrent request.
+    The underlying client is opened on first use; close it with close()
+    or by using the adapter as an async context manager.
+
+    Configuration required:
+        - bucket_name: S3 bucket name
+        - region: AWS region (optional, defaults to us-east-1)
+        - max_pool_connections: Size of the HTTP connection pool (optional,
+          defaults to 50)
+        - s3_max_concurrency: Parallel part transfers for uploads (optional,
+          defaults to 10)
+
+    Credentials required:
+        - access_key_id: AWS access key ID
+        - secret_access_key: AWS secret access key
+        - session_token: AWS session token (optional, for temporary credentials)
+
+    Example:
+        >>> async with AsyncS3StorageAdapter(config, credentials) as adapter:
+        ...     data = await adapter.download_file('datasets/data.csv')
+    """
+
+    def __init__(self, config: Dict[str, Any], credentials: Optional[Dict[str, Any]] = None):
+        """Initialize async S3 storage adapter."""
+        super().__init__(config, credentials)
+        self._bucket_name = self.config['bucket_name']
+        self._session = self._create_session()
+        self._transfer_config = TransferConfig(
+            max_concurrency=self.config.get('s3_max_concurrency', 10)
+        )
+        self._exit_stack = None
+        self._client = None
+        self._client_lock = None
+
+    def _validate_config(self) -> None:
+        """Validate S3 configuration."""
+        if 'bucket_name' not in self.config:
+            raise ValueError("S3 adapter requires 'bucket_name' in config")
+
+        if not self.config['bucket_name']:
+            raise ValueError("bucket_name cannot be empty")
+
+    def _create_session(self) -> 'aioboto3.Session':
+        """Create aioboto3 session from credentials."""
+        session_kwargs = {}
+        if self.credentials:
+            session_kwargs['aws_access_key_id'] = self.credentials.get('access_key_id')
+            session_kwargs['aws_secret_access_key'] = self.credentials.get('secret_access_key')
+
+            if 'session_token' in self.credentials:
+                session_kwargs['aws_session_token'] = self.credentials['session_token']
+
+        return aioboto3.Session(**session_kwargs)
+
+    async def _get_client(self):
+        """Open the S3 client on first use and reuse it afterwards."""
+        if self._client is not None:
+            return self._client
+
+        # Created lazily so the lock binds to the running event loop
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+
+        async with self._client_lock:
+            if self._client is None:
+                try:
+                    boto_config = AioConfig(
+                        region_name=self.config.get('region', 'us-east-1'),
+                        connect_timeout=10,
+                        read_timeout=30,
+                        retries={'max_attempts': 3, 'mode': 'standard'},
+                        max_pool_connections=self.config.get('max_pool_connections', 50)
+                    )
+                    exit_stack = AsyncExitStack()
+                    self._client = await exit_stack.enter_async_context(
+                        self._session.client('s3', config=boto_config)
+                    )
+                    self._exit_stack = exit_stack
+                except Exception as e:
+                    logger.error(f"Failed to initialize async S3 client: {e}")
+                    raise StorageConnectionError(f"S3 client initialization failed: {e}")
+
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying S3 client and its connection pool."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._client = None
+
+    async def test_connection(self, timeout: int = 10) -> bool:
+        """Test S3 connection by checking bucket access."""
+        bucket_name = self._bucket_name
+        try:
+            client = await self._get_client()
+            await client.head_bucket(Bucket=bucket_name)
+            logger.info(f"Successfully connected to S3 bucket: {bucket_name}")
+            return True
+
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+
+            if error_code == '404':
+                raise StorageConnectionError(f"S3 bucket '{bucket_name}' does not exist")
+            elif error_code == '403':
+                raise StoragePermissionError(f"Access denied to S3 bucket '{bucket_name}'")
+            else:
+                raise StorageConnectionError(f"S3 connection failed: {e}")
+
+        except BotoCoreError as e:
+            raise StorageConnectionError(f"S3 connection failed: {e}")
+
+    async def upload_file(
+        self,
+        file_obj: BinaryIO,
+        key: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Upload file to S3."""
+        try:
+            client = await self._get_client()
+            extra_args = {}
+
+            if content_type:
+                extra_args['ContentType'] = content_type
+
+            if metadata:
+                extra_args['Metadata'] = metadata
+
+            await client.upload_fileobj(
+                file_obj,
+                self._bucket_name,
+                key,
+                ExtraArgs=extra_args if extra_args else None,
+                Config=self._transfer_config
+            )
+
+            logger.info(f"Uploaded file to S3: s3://{self._bucket_name}/{key}")
+            return key
+
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code == '403':
+                raise StoragePermissionError(f"Permission denied uploading to S3: {key}")
+            raise StorageOperationError(f"S3 upload failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"S3 upload failed: {e}")
+
+    async def download_file(self, key: str, destination: Optional[Path] = None) -> bytes:
+        """Download file from S3."""
+        try:
+            client = await self._get_client()
+            response = await client.get_object(Bucket=self._bucket_name, Key=key)
+            async with response['Body'] as stream:
+                data = await stream.read()
+
+            if destination:
+                # Keep the blocking disk write off the event loop
+                await asyncio.to_thread(Path(destination).write_bytes, data)
+                logger.info(f"Downloaded S3 file to: {destination}")
+            else:
+                logger.info(f"Downloaded S3 file: s3://{self._bucket_name}/{key}")
+
+            return data
+
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code in ('NoSuchKey', '404'):
+                raise StorageNotFoundError(f"File not found in S3: {key}")
+            elif error_code == '403':
+                raise StoragePermissionError(f"Permission denied downloading from S3: {key}")
+            raise StorageOperationError(f"S3 download failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"S3 download failed: {e}")
+
+    async def delete_file(self, key: str) -> bool:
+        """
+        Delete file from S3.
+
+        Like the sync adapter, deleting a missing key succeeds.
+        """
+        try:
+            client = await self._get_client()
+            await client.delete_object(Bucket=self._bucket_name, Key=key)
+            logger.info(f"Deleted S3 file: s3://{self._bucket_name}/{key}")
+            return True
+
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code == '403':
+                raise StoragePermissionError(f"Permission denied deleting from S3: {key}")
+            raise StorageOperationError(f"S3 delete failed: {e}")
+        except Exception as e:
+            raise StorageOperationError(f"S3 delete failed: {e}")
+
+    async def file_exists(self, key: str) -> bool:
+        """Check if file exists in S3."""
+        try:
+            client = await self._get_client()
+            await client.head_object(Bucket=self._bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code == '404':
+                return False
+            raise StorageOperationError(f"S3 file_exists check failed: {e}")
+
+    async def get_file_metadata(self, key: str) -> StorageObject:
+        """Get file metadata from S3."""
+        try:
+            client = await self._get_client()
+            response = await client.head_object(Bucket=self._bucket_name, Key=key)
+
+            return StorageObject(
+                key=key,
+                size=response['ContentLength'],
+                last_modified=response['LastModified'],
+                etag=response.get('ETag', '').strip('"'),
+                content_type=response.get('ContentType'),
+                metadata=response.get('Metadata', {})
+            )
+
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+            if error_code == '404':
+                raise StorageNotFoundError(f"File not found in S3: {key}")
+            raise StorageOperationError(f"S3 metadata retrieval failed: {e}")
+
+    async def list_files(self, prefix: str = "", max_results: int = 1000) -> list[StorageObject]:
+        """List files in S3 bucket."""
+        try:
+            client = await self._get_client()
+            files = []
+
+            paginator = client.get_paginator('list_objects_v2')
+            page_iterator = paginator.paginate(
+                Bucket=self._bucket_name,
+                Prefix=prefix,
+                PaginationConfig={'MaxItems': max_results}
+            )
+
+            async for page in page_iterator:
+                for obj in page.get('Contents', []):
+                    files.append(StorageObject(
+                        key=obj['Key'],
+                        size=obj['Size'],
+                        last_modified=obj['LastModified'],
+                        etag=obj.get('ETag', '').strip('"')
+                    ))
+
+            logger.info(f"Listed {len(files)} files from S3 with prefix: {prefix}")
+            return files
+
+        except ClientError as e:
+            raise StorageOperationError(f"S3 list operation failed: {e}")
+
+    async def generate_presigned_url(
+        self,
+        key: str,
+        expiration: int = 3600,
+        method: str = "GET"
+    ) -> PresignedUrl:
+        """Generate presigned URL for S3 object."""
+        try:
+            operation_map = {
+                'GET': 'get_object',
+                'PUT': 'put_object',
+                'DELETE': 'delete_object'
+            }
+
+            operation = operation_map.get(method.upper())
+            if not operation:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            client = await self._get_client()
+            url = await client.generate_presigned_url(
+                operation,
+                Params={'Bucket': self._bucket_name, 'Key': key},
+                ExpiresIn=expiration
+            )
+
+            expires_at = datetime.now(timezone.utc) + timedelta(seconds=expiration)
+
+            return PresignedUrl(
+                url=url,
+                expires_at=expires_at,
+                method=method.upper()
+            )
+
+        except ClientError as e:
+            raise StorageOperationError(f"S3 presigned URL generation failed: {e}")
+
+    def get_public_url(self, key: str) -> Optional[str]:
+        """Get public URL for S3 object (if bucket is public)."""
+        region = self.config.get('region', 'us-east-1')
+
+        # Standard S3 URL format
+        if region == 'us-east-1':
+            return f"https://{self._bucket_name}.s3.amazonaws.com/{key}"
+        else:
+            return f"https://{self._bucket_name}.s3.{region}.amazonaws.com/{key}"
@@ -6,8 +6,13 @@ This module defines the abstract base class that all storage adapters must imple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from io import BytesIO
 from typing import Optional, BinaryIO, Dict, Any
 from pathlib import Path
+import sys
+
+# Slotted dataclasses require Python 3.10+; older interpreters keep __dict__.
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class StorageError(Exception):
@@ -35,7 +40,7 @@ class StoragePermissionError(StorageError):
     pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StorageObject:
     """Represents metadata about a stored object."""
     key: str
@@ -46,7 +51,7 @@ class StorageObject:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PresignedUrl:
     """Represents a presigned URL for temporary access."""
     url: str
@@ -151,6 +156,10 @@ class BaseStorageAdapter(ABC):
         """
         Delete a file from storage.
 
+        Deleting a missing key is backend-dependent: S3 (sync and async)
+        treats it as success and returns True, while MinIO, Azure and the
+        local filesystem raise StorageNotFoundError.
+
         Args:
             key: Path/key of the file to delete.
 
@@ -158,11 +167,65 @@ class BaseStorageAdapter(ABC):
             True if deletion successful.
 
         Raises:
-            StorageNotFoundError: If file doesn't exist.
+            StorageNotFoundError: If file doesn't exist (backend-dependent).
             StorageOperationError: If deletion fails.
         """
         pass
 
+    def delete_files(self, keys: list[str]) -> Dict[str, bool]:
+        """
+        Delete multiple files from storage.
+
+        Backends with a bulk delete API override this to remove many keys
+        per request; the default deletes the keys one at a time.
+
+        As with delete_file, missing keys are backend-dependent: S3 and
+        MinIO report them as True, while Azure and the local filesystem
+        report them as False.
+
+        Args:
+            keys: Paths/keys of the files to delete.
+
+        Returns:
+            Mapping of each key to True if it was deleted (or, on S3 and
+            MinIO, did not exist), False otherwise.
+        """
+        results = {}
+        for key in dict.fromkeys(keys):
+            try:
+                results[key] = self.delete_file(key)
+            except StorageError:
+                results[key] = False
+        return results
+
+    def copy_file(self, src_key: str, dst_key: str) -> str:
+        """
+        Copy a file to another key in the same storage.
+
+        Backends that can copy server-side override this so the data never
+        passes through the client; the default downloads the file and
+        uploads it again with its content type and metadata.
+
+        Args:
+            src_key: Path/key of the file to copy.
+            dst_key: Destination path/key.
+
+        Returns:
+            The key/path where the copy was stored.
+
+        Raises:
+            StorageNotFoundError: If the source file doesn't exist.
+            StorageOperationError: If the copy fails.
+        """
+        source = self.get_file_metadata(src_key)
+        data = self.download_file(src_key)
+        return self.upload_file(
+            BytesIO(data),
+            dst_key,
+            content_type=source.content_type,
+            metadata=source.metadata
+        )
+
     @abstractmethod
     def file_exists(self, key: str) -> bool:
         """
@@ -176,6 +239,24 @@ class BaseStorageAdapter(ABC):
         """
         pass
 
+    def bulk_exists(self, keys: list[str]) -> Dict[str, bool]:
+        """
+        Check whether multiple files exist.
+
+        Backends that can answer many keys from one listing override this;
+        the default calls file_exists for each key.
+
+        Args:
+            keys: Paths/keys of the files to check.
+
+        Returns:
+            Mapping of each key to True if it exists, False otherwise.
+
+        Raises:
+            StorageOperationError: If a check fails.
+        """
+        return {key: self.file_exists(key) for key in dict.fromkeys(keys)}
+
     @abstractmethod
     def get_file_metadata(self, key: str) -> StorageObject:
         """
@@ -209,6 +290,34 @@ class BaseStorageAdapter(ABC):
         """
         pass
 
+    def list_files_columnar(self, prefix: str = "", max_results: int = 1000) -> Dict[str, list]:
+        """
+        List files as parallel columns rather than StorageObject instances.
+
+        Suited to bulk processing (filtering by size, sorting by date,
+        collecting keys) and cheap to hand to numpy or pandas. Backends
+        that can build the columns straight from their listing responses
+        override this; the default reshapes list_files().
+
+        Args:
+            prefix: Filter results to keys starting with this prefix.
+            max_results: Maximum number of results to return.
+
+        Returns:
+            Dict with equal-length 'key', 'size', 'last_modified' and
+            'etag' lists.
+
+        Raises:
+            StorageOperationError: If listing fails.
+        """
+        files = self.list_files(prefix, max_results)
+        return {
+            'key': [f.key for f in files],
+            'size': [f.size for f in files],
+            'last_modified': [f.last_modified for f in files],
+            'etag': [f.etag for f in files],
+        }
+
     @abstractmethod
     def generate_presigned_url(
         self,
@@ -248,4 +357,116 @@ class BaseStorageAdapter(ABC):
         """String representation without exposing credentials."""
         backend_type = self.__class__.__name__
         config_keys = list(self.config.keys())
-        return f"<{backend_type} config_keys={config_keys}>"
\ No newline at end of file
+        return f"<{backend_type} config_keys={config_keys}>"
+
+
+class AsyncBaseStorageAdapter(ABC):
+    """
+    Abstract base class for asyncio-native storage adapters.
+    
+    Mirrors the BaseStorageAdapter interface with coroutine methods, for
+    workloads with many small requests in flight at once. Adapters may hold
+    open network clients, so use them as async context managers or call
+    close() when done.
+    """
+
+    def __init__(self, config: Dict[str, Any], credentials: Optional[Dict[str, Any]] = None):
+        """
+        Initialize async storage adapter.
+
+        Args:
+            config: Backend-specific configuration (bucket name, region, etc.)
+            credentials: Authentication credentials (access keys, tokens, etc.)
+        """
+        self.config = config
+        self.credentials = credentials or {}
+        self._validate_config()
+
+    @abstractmethod
+    def _validate_config(self) -> None:
+        """
+        Validate that required configuration parameters are present.
+        
+        Raises:
+            ValueError: If required configuration is missing or invalid.
+        """
+        pass
+
+    @abstractmethod
+    async def test_connection(self, timeout: int = 10) -> bool:
+        """Async counterpart of BaseStorageAdapter.test_connection."""
+        pass
+
+    @abstractmethod
+    async def upload_file(
+        self,
+        file_obj: BinaryIO,
+        key: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Async counterpart of BaseStorageAdapter.upload_file."""
+        pass
+
+    @abstractmethod
+    async def download_file(self, key: str, destination: Optional[Path] = None) -> bytes:
+        """Async counterpart of BaseStorageAdapter.download_file."""
+        pass
+
+    @abstractmethod
+    async def delete_file(self, key: str) -> bool:
+        """Async counterpart of BaseStorageAdapter.delete_file."""
+        pass
+
+    @abstractmethod
+    async def file_exists(self, key: str) -> bool:
+        """Async counterpart of BaseStorageAdapter.file_exists."""
+        pass
+
+    @abstractmethod
+    async def get_file_metadata(self, key: str) -> StorageObject:
+        """Async counterpart of BaseStorageAdapter.get_file_metadata."""
+        pass
+
+    @abstractmethod
+    async def list_files(self, prefix: str = "", max_results: int = 1000) -> list[StorageObject]:
+        """Async counterpart of BaseStorageAdapter.list_files."""
+        pass
+
+    @abstractmethod
+    async def generate_presigned_url(
+        self,
+        key: str,
+        expiration: int = 3600,
+        method: str = "GET"
+    ) -> PresignedUrl:
+        """Async counterpart of BaseStorageAdapter.generate_presigned_url."""
+        pass
+
+    def get_public_url(self, key: str) -> Optional[str]:
+        """
+        Get public URL for a file (if supported by backend).
+
+        Args:
+            key: Path/key of the file.
+
+        Returns:
+            Public URL string or None if not publicly accessible.
+        """
+        return None
+
+    async def close(self) -> None:
+        """Release any network resources held by the adapter."""
+        pass
+
+    async def __aenter__(self) -> 'AsyncBaseStorageAdapter':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        """String representation without exposing credentials."""
+        backend_type = self.__class__.__name__
+        config_keys = list(self.config.keys())
+        return f"<{backend_type} config_keys={config_keys}>"
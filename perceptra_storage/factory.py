@@ -27,6 +27,20 @@ class StorageAdapterError(Exception):
     pass
 
 
+def _lookup_adapter(backend: str) -> tuple[str, Optional[type]]:
+    """
+    Resolve a backend name to its registered adapter class.
+    
+    Registry keys are stored normalized, so names that are already
+    lowercase and trimmed resolve with a single lookup.
+    """
+    adapter_class = ADAPTER_REGISTRY.get(backend)
+    if adapter_class is None:
+        backend = backend.lower().strip()
+        adapter_class = ADAPTER_REGISTRY.get(backend)
+    return backend, adapter_class
+
+
 def get_storage_adapter(
     backend: str,
     config: Dict[str, Any],
@@ -53,17 +67,15 @@ def get_storage_adapter(
         >>> adapter.test_connection()
         True
     """
-    backend = backend.lower().strip()
+    backend, adapter_class = _lookup_adapter(backend)
     
-    if backend not in ADAPTER_REGISTRY:
+    if adapter_class is None:
         available = ', '.join(ADAPTER_REGISTRY.keys())
         raise StorageAdapterError(
             f"Unknown storage backend: '{backend}'. "
             f"Available backends: {available}"
         )
     
-    adapter_class = ADAPTER_REGISTRY[backend]
-    
     try:
         logger.info(f"Creating {backend} storage adapter")
         adapter = adapter_class(config=config, credentials=credentials)
@@ -130,13 +142,11 @@ def get_adapter_info(backend: str) -> Dict[str, Any]:
     Raises:
         StorageAdapterError: If backend is unknown
     """
-    backend = backend.lower().strip()
+    backend, adapter_class = _lookup_adapter(backend)
     
-    if backend not in ADAPTER_REGISTRY:
+    if adapter_class is None:
         raise StorageAdapterError(f"Unknown storage backend: '{backend}'")
     
-    adapter_class = ADAPTER_REGISTRY[backend]
-    
     return {
         'backend': backend,
         'class_name': adapter_class.__name__,
@@ -46,8 +46,10 @@ setup(
     ],
     extras_require={
         's3': ['boto3>=1.26.0'],
+        's3-async': ['aioboto3>=12.0.0'],
         'azure': ['azure-storage-blob>=12.0.0'],
         'minio': ['minio>=7.1.0'],
+        'speedups': ['orjson>=3.8.0'],
         'all': [
             'boto3>=1.26.0',
             'azure-storage-blob>=12.0.0',
@@ -57,6 +59,8 @@ setup(
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',
             'pytest-mock>=3.10.0',
+            'pytest-benchmark>=4.0.0',
+            'pytest-xdist>=3.5.0',
             'black>=23.0.0',
             'isort>=5.12.0',
             'flake8>=6.0.0',
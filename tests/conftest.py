@@ -0,0 +1,103 @@
+"""
+Shared fixtures for storage adapter tests.
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+from perceptra_storage import get_adapter_info, list_available_backends
+from perceptra_storage.base import BaseStorageAdapter
+
+
+# Linux tmpfs; keeps tmp_path I/O in memory instead of on disk
+_SHM_DIR = '/dev/shm'
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Respect an explicit --basetemp (including the ones xdist hands workers)
+    if config.option.basetemp is None and os.access(_SHM_DIR, os.W_OK):
+        basetemp = tempfile.mkdtemp(prefix='perceptra-storage-', dir=_SHM_DIR)
+        config.option.basetemp = basetemp
+        config._shm_basetemp = basetemp
+
+
+def pytest_unconfigure(config):
+    basetemp = getattr(config, '_shm_basetemp', None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Upload bodies built once for tests that write many small files
+PAYLOADS = [f'File {i}'.encode() for i in range(16)]
+
+
+class StubAdapter(BaseStorageAdapter):
+    """Minimal adapter implementing every abstract method as a no-op."""
+    
+    def _validate_config(self):
+        pass
+    
+    def test_connection(self, timeout=10):
+        return True
+    
+    def upload_file(self, file_obj, key, content_type=None, metadata=None):
+        return key
+    
+    def download_file(self, key, destination=None):
+        return b''
+    
+    def delete_file(self, key):
+        return True
+    
+    def file_exists(self, key):
+        return False
+    
+    def get_file_metadata(self, key):
+        pass
+    
+    def list_files(self, prefix="", max_results=1000):
+        return []
+    
+    def generate_presigned_url(self, key, expiration=3600, method="GET"):
+        pass
+
+
+@pytest.fixture
+def stub_adapter_cls():
+    """Concrete BaseStorageAdapter subclass for tests that need one."""
+    return StubAdapter
+
+
+@pytest.fixture(scope="session")
+def payloads():
+    """Prebuilt small file bodies, indexed by file number."""
+    return PAYLOADS
+
+
+@pytest.fixture(scope="module")
+def backend_list():
+    """Backends available before a test module registers its own."""
+    return list_available_backends()
+
+
+@pytest.fixture(scope="module")
+def adapter_infos():
+    """get_adapter_info() for each built-in backend, computed once per module."""
+    return {backend: get_adapter_info(backend) for backend in ('s3', 'azure', 'minio', 'local')}
@@ -0,0 +1,75 @@
+"""
+Unit tests for Azure Blob Storage adapter.
+"""
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("azure.storage.blob")
+
+from azure.core.exceptions import HttpResponseError
+
+from perceptra_storage import AzureStorageAdapter, StorageOperationError, StoragePermissionError
+from perceptra_storage.adapters import azure as azure_module
+
+pytestmark = pytest.mark.azure
+
+CREDENTIALS = {'account_key': base64.b64encode(b'k' * 32).decode()}
+
+
+@pytest.fixture
+def azure_adapter():
+    """Create an Azure adapter; the client never touches the network on init."""
+    config = {'container_name': 'my-container', 'account_name': 'myaccount'}
+    return AzureStorageAdapter(config, CREDENTIALS)
+
+
+@pytest.fixture
+def delete_blobs(azure_adapter, monkeypatch):
+    """Replace batch deletes with canned per-blob status codes."""
+    batches = []
+    statuses = {}
+    
+    def fake_delete_blobs(*blobs, raise_on_any_failure=True):
+        batches.append(blobs)
+        return iter([SimpleNamespace(status_code=statuses.get(blob, 202)) for blob in blobs])
+    
+    monkeypatch.setattr(azure_adapter._container_client, 'delete_blobs', fake_delete_blobs)
+    return SimpleNamespace(batches=batches, statuses=statuses)
+
+
+class TestAzureAdapterDeleteFiles:
+    """Test bulk deletes of the Azure adapter."""
+    
+    def test_missing_blobs_reported_as_not_deleted(self, azure_adapter, delete_blobs):
+        """Test 404 sub-responses map to False."""
+        delete_blobs.statuses['missing'] = 404
+        
+        results = azure_adapter.delete_files(['ok', 'missing', 'ok'])
+        
+        assert results == {'ok': True, 'missing': False}
+        assert delete_blobs.batches == [('ok', 'missing')]
+    
+    def test_batches_requests(self, azure_adapter, delete_blobs, monkeypatch):
+        """Test keys are split into batch requests."""
+        monkeypatch.setattr(azure_module, '_DELETE_BATCH_SIZE', 2)
+        keys = [f'blob{i}' for i in range(5)]
+        
+        assert azure_adapter.delete_files(keys) == dict.fromkeys(keys, True)
+        assert [len(batch) for batch in delete_blobs.batches] == [2, 2, 1]
+    
+    def test_batch_failure_raises(self, azure_adapter, monkeypatch):
+        """Test a failed batch request maps to the storage exceptions."""
+        def fail(*blobs, **kwargs):
+            error = HttpResponseError(message='denied')
+            error.status_code = 403
+            raise error
+        
+        monkeypatch.setattr(azure_adapter._container_client, 'delete_blobs', fail)
+        with pytest.raises(StoragePermissionError):
+            azure_adapter.delete_files(['blob'])
+        
+        monkeypatch.setattr(azure_adapter._container_client, 'delete_blobs', lambda *b, **k: 1 / 0)
+        with pytest.raises(StorageOperationError):
+            azure_adapter.delete_files(['blob'])
@@ -1,10 +1,12 @@
 """
 Unit tests for base storage adapter functionality.
 """
+import sys
 import pytest
 from datetime import datetime, timezone
 from perceptra_storage.base import (
     BaseStorageAdapter,
+    AsyncBaseStorageAdapter,
     StorageObject,
     PresignedUrl,
     StorageError,
@@ -18,32 +20,18 @@ from perceptra_storage.base import (
 class TestStorageExceptions:
     """Test storage exception hierarchy."""
     
-    def test_base_exception(self):
-        """Test base StorageError exception."""
-        exc = StorageError("Test error")
-        assert str(exc) == "Test error"
-        assert isinstance(exc, Exception)
-    
-    def test_connection_error(self):
-        """Test StorageConnectionError inherits from StorageError."""
-        exc = StorageConnectionError("Connection failed")
-        assert isinstance(exc, StorageError)
-        assert str(exc) == "Connection failed"
-    
-    def test_operation_error(self):
-        """Test StorageOperationError inherits from StorageError."""
-        exc = StorageOperationError("Operation failed")
-        assert isinstance(exc, StorageError)
-    
-    def test_not_found_error(self):
-        """Test StorageNotFoundError inherits from StorageError."""
-        exc = StorageNotFoundError("File not found")
-        assert isinstance(exc, StorageError)
-    
-    def test_permission_error(self):
-        """Test StoragePermissionError inherits from StorageError."""
-        exc = StoragePermissionError("Access denied")
+    @pytest.mark.parametrize("exc_cls", [
+        StorageError,
+        StorageConnectionError,
+        StorageOperationError,
+        StorageNotFoundError,
+        StoragePermissionError,
+    ])
+    def test_exception_is_storage_error(self, exc_cls):
+        """Test each storage exception inherits from StorageError and keeps its message."""
+        exc = exc_cls("Test error")
         assert isinstance(exc, StorageError)
+        assert str(exc) == "Test error"
 
 
 class TestStorageObject:
@@ -80,6 +68,13 @@ class TestStorageObject:
         assert obj.etag is None
         assert obj.content_type is None
         assert obj.metadata is None
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots require Python 3.10+")
+    def test_storage_object_uses_slots(self):
+        """Test StorageObject instances don't carry a per-instance __dict__."""
+        obj = StorageObject(key="file.txt", size=1, last_modified=datetime.now(timezone.utc))
+        
+        assert not hasattr(obj, '__dict__')
 
 
 class TestPresignedUrl:
@@ -117,59 +112,28 @@ class TestBaseStorageAdapter:
         with pytest.raises(TypeError):
             BaseStorageAdapter({}, {})
     
-    def test_repr_hides_credentials(self):
+    def test_repr_hides_credentials(self, stub_adapter_cls):
         """Test that __repr__ doesn't expose credentials."""
-        class DummyAdapter(BaseStorageAdapter):
-            def _validate_config(self):
-                pass
-            def test_connection(self, timeout=10):
-                return True
-            def upload_file(self, file_obj, key, content_type=None, metadata=None):
-                return key
-            def download_file(self, key, destination=None):
-                return b''
-            def delete_file(self, key):
-                return True
-            def file_exists(self, key):
-                return False
-            def get_file_metadata(self, key):
-                pass
-            def list_files(self, prefix="", max_results=1000):
-                return []
-            def generate_presigned_url(self, key, expiration=3600, method="GET"):
-                pass
-        
         config = {'bucket': 'test', 'key': 'value'}
         credentials = {'secret': 'should_not_appear'}
-        adapter = DummyAdapter(config, credentials)
+        adapter = stub_adapter_cls(config, credentials)
         
         repr_str = repr(adapter)
-        assert 'DummyAdapter' in repr_str
+        assert 'StubAdapter' in repr_str
         assert 'bucket' in repr_str or 'key' in repr_str
         assert 'should_not_appear' not in repr_str
         assert 'secret' not in repr_str
     
-    def test_get_public_url_default(self):
+    def test_get_public_url_default(self, stub_adapter_cls):
         """Test default get_public_url returns None."""
-        class DummyAdapter(BaseStorageAdapter):
-            def _validate_config(self):
-                pass
-            def test_connection(self, timeout=10):
-                return True
-            def upload_file(self, file_obj, key, content_type=None, metadata=None):
-                return key
-            def download_file(self, key, destination=None):
-                return b''
-            def delete_file(self, key):
-                return True
-            def file_exists(self, key):
-                return False
-            def get_file_metadata(self, key):
-                pass
-            def list_files(self, prefix="", max_results=1000):
-                return []
-            def generate_presigned_url(self, key, expiration=3600, method="GET"):
-                pass
-        
-        adapter = DummyAdapter({}, {})
-        assert adapter.get_public_url('test.txt') is None
\ No newline at end of file
+        adapter = stub_adapter_cls({}, {})
+        assert adapter.get_public_url('test.txt') is None
+
+
+class TestAsyncBaseStorageAdapter:
+    """Test AsyncBaseStorageAdapter abstract class."""
+    
+    def test_cannot_instantiate_directly(self):
+        """Test that AsyncBaseStorageAdapter cannot be instantiated directly."""
+        with pytest.raises(TypeError):
+            AsyncBaseStorageAdapter({}, {})
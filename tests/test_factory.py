@@ -8,58 +8,51 @@ from perceptra_storage import (
     list_available_backends,
     get_adapter_info,
     StorageAdapterError,
-    BaseStorageAdapter,
     S3StorageAdapter,
     AzureStorageAdapter,
     MinIOStorageAdapter,
     LocalStorageAdapter,
 )
+from perceptra_storage.factory import ADAPTER_REGISTRY
+
+
+@pytest.fixture(autouse=True)
+def _snapshot_registry():
+    """Restore the adapter registry after each test that may register adapters."""
+    saved = dict(ADAPTER_REGISTRY)
+    yield
+    ADAPTER_REGISTRY.clear()
+    ADAPTER_REGISTRY.update(saved)
 
 
 class TestGetStorageAdapter:
     """Test get_storage_adapter factory function."""
     
-    def test_create_s3_adapter(self):
-        """Test creating S3 adapter."""
-        config = {'bucket_name': 'test-bucket', 'region': 'us-east-1'}
-        credentials = {'access_key_id': 'key', 'secret_access_key': 'secret'}
-        
-        adapter = get_storage_adapter('s3', config, credentials)
-        assert isinstance(adapter, S3StorageAdapter)
-    
-    def test_create_azure_adapter(self):
-        """Test creating Azure adapter."""
-        config = {'container_name': 'test', 'account_name': 'account'}
-        credentials = {'account_key': 'key'}
-        
-        adapter = get_storage_adapter('azure', config, credentials)
-        assert isinstance(adapter, AzureStorageAdapter)
-    
-    def test_create_minio_adapter(self):
-        """Test creating MinIO adapter."""
-        config = {'bucket_name': 'test', 'endpoint_url': 'localhost:9000'}
-        credentials = {'access_key': 'key', 'secret_key': 'secret'}
-        
-        adapter = get_storage_adapter('minio', config, credentials)
-        assert isinstance(adapter, MinIOStorageAdapter)
-    
-    def test_create_local_adapter(self):
-        """Test creating Local adapter."""
+    @pytest.mark.parametrize(
+        "backend,config,credentials,expected_cls",
+        [
+            ('s3', {'bucket_name': 'test-bucket', 'region': 'us-east-1'},
+             {'access_key_id': 'key', 'secret_access_key': 'secret'}, S3StorageAdapter),
+            ('azure', {'container_name': 'test', 'account_name': 'account'},
+             {'account_key': 'key'}, AzureStorageAdapter),
+            ('minio', {'bucket_name': 'test', 'endpoint_url': 'localhost:9000'},
+             {'access_key': 'key', 'secret_key': 'secret'}, MinIOStorageAdapter),
+            ('local', {'base_path': '/tmp/storage'}, None, LocalStorageAdapter),
+        ],
+        ids=['s3', 'azure', 'minio', 'local']
+    )
+    def test_create_adapter(self, backend, config, credentials, expected_cls):
+        """Test creating each built-in adapter."""
+        adapter = get_storage_adapter(backend, config, credentials)
+        assert isinstance(adapter, expected_cls)
+    
+    @pytest.mark.parametrize("backend", ['LOCAL', 'local', 'Local', '  local  '])
+    def test_backend_name_is_normalized(self, backend):
+        """Test that backend name is case-insensitive and whitespace is stripped."""
         config = {'base_path': '/tmp/storage'}
-        
-        adapter = get_storage_adapter('local', config)
+        adapter = get_storage_adapter(backend, config)
         assert isinstance(adapter, LocalStorageAdapter)
     
-    def test_case_insensitive_backend(self):
-        """Test that backend name is case-insensitive."""
-        config = {'base_path': '/tmp/storage'}
-        
-        adapter1 = get_storage_adapter('LOCAL', config)
-        adapter2 = get_storage_adapter('local', config)
-        adapter3 = get_storage_adapter('Local', config)
-        
-        assert type(adapter1) == type(adapter2) == type(adapter3)
-    
     def test_unknown_backend(self):
         """Test that unknown backend raises error."""
         with pytest.raises(StorageAdapterError) as exc_info:
@@ -73,38 +66,14 @@ class TestGetStorageAdapter:
         with pytest.raises(StorageAdapterError):
             # Missing required bucket_name
             get_storage_adapter('s3', {})
-    
-    def test_whitespace_in_backend_name(self):
-        """Test that whitespace is stripped from backend name."""
-        config = {'base_path': '/tmp/storage'}
-        adapter = get_storage_adapter('  local  ', config)
-        assert isinstance(adapter, LocalStorageAdapter)
 
 
 class TestRegisterAdapter:
     """Test register_adapter function."""
     
-    def test_register_custom_adapter(self):
+    def test_register_custom_adapter(self, stub_adapter_cls):
         """Test registering a custom adapter."""
-        class CustomAdapter(BaseStorageAdapter):
-            def _validate_config(self):
-                pass
-            def test_connection(self, timeout=10):
-                return True
-            def upload_file(self, file_obj, key, content_type=None, metadata=None):
-                return key
-            def download_file(self, key, destination=None):
-                return b''
-            def delete_file(self, key):
-                return True
-            def file_exists(self, key):
-                return False
-            def get_file_metadata(self, key):
-                pass
-            def list_files(self, prefix="", max_results=1000):
-                return []
-            def generate_presigned_url(self, key, expiration=3600, method="GET"):
-                pass
+        CustomAdapter = type('CustomAdapter', (stub_adapter_cls,), {})
         
         register_adapter('custom', CustomAdapter)
         
@@ -131,45 +100,22 @@ class TestRegisterAdapter:
         config = {'base_path': '/tmp/storage'}
         adapter = get_storage_adapter('local', config)
         assert isinstance(adapter, CustomLocal)
-        
-        # Reset to original
-        register_adapter('local', LocalStorageAdapter)
 
 
 class TestListAvailableBackends:
     """Test list_available_backends function."""
     
-    def test_list_backends(self):
+    def test_list_backends(self, backend_list):
         """Test listing available backends."""
-        backends = list_available_backends()
-        
-        assert isinstance(backends, list)
-        assert 's3' in backends
-        assert 'azure' in backends
-        assert 'minio' in backends
-        assert 'local' in backends
+        assert isinstance(backend_list, list)
+        assert 's3' in backend_list
+        assert 'azure' in backend_list
+        assert 'minio' in backend_list
+        assert 'local' in backend_list
     
-    def test_list_includes_custom_backends(self):
+    def test_list_includes_custom_backends(self, stub_adapter_cls):
         """Test that list includes custom registered backends."""
-        class CustomAdapter(BaseStorageAdapter):
-            def _validate_config(self):
-                pass
-            def test_connection(self, timeout=10):
-                return True
-            def upload_file(self, file_obj, key, content_type=None, metadata=None):
-                return key
-            def download_file(self, key, destination=None):
-                return b''
-            def delete_file(self, key):
-                return True
-            def file_exists(self, key):
-                return False
-            def get_file_metadata(self, key):
-                pass
-            def list_files(self, prefix="", max_results=1000):
-                return []
-            def generate_presigned_url(self, key, expiration=3600, method="GET"):
-                pass
+        CustomAdapter = type('CustomAdapter', (stub_adapter_cls,), {})
         
         register_adapter('test_custom', CustomAdapter)
         backends = list_available_backends()
@@ -180,18 +126,18 @@ class TestListAvailableBackends:
 class TestGetAdapterInfo:
     """Test get_adapter_info function."""
     
-    def test_get_s3_info(self):
+    def test_get_s3_info(self, adapter_infos):
         """Test getting S3 adapter info."""
-        info = get_adapter_info('s3')
+        info = adapter_infos['s3']
         
         assert info['backend'] == 's3'
         assert info['class_name'] == 'S3StorageAdapter'
         assert 'module' in info
         assert 'docstring' in info
     
-    def test_get_azure_info(self):
+    def test_get_azure_info(self, adapter_infos):
         """Test getting Azure adapter info."""
-        info = get_adapter_info('azure')
+        info = adapter_infos['azure']
         
         assert info['backend'] == 'azure'
         assert info['class_name'] == 'AzureStorageAdapter'
@@ -2,9 +2,7 @@
 Unit tests for local filesystem storage adapter.
 """
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
+import re
 from io import BytesIO
 from perceptra_storage import (
     LocalStorageAdapter,
@@ -15,47 +13,50 @@ from perceptra_storage import (
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    temp_path = tempfile.mkdtemp()
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def local_adapter(tmp_path):
+    """Create a local storage adapter instance."""
+    config = {'base_path': str(tmp_path), 'create_dirs': True}
+    return LocalStorageAdapter(config)
 
 
-@pytest.fixture
-def local_adapter(temp_dir):
-    """Create a local storage adapter instance."""
-    config = {'base_path': temp_dir, 'create_dirs': True}
+@pytest.fixture(scope="session")
+def session_local_adapter(tmp_path_factory):
+    """Create a local storage adapter shared by non-destructive tests."""
+    config = {'base_path': str(tmp_path_factory.mktemp('local-shared')), 'create_dirs': True}
     return LocalStorageAdapter(config)
 
 
+@pytest.fixture
+def key_prefix(request):
+    """Unique key prefix that keeps tests on the shared adapter independent."""
+    return re.sub(r'[^\w.-]+', '_', request.node.nodeid) + '/'
+
+
 class TestLocalAdapterInitialization:
     """Test local adapter initialization."""
     
-    def test_init_with_valid_config(self, temp_dir):
+    def test_init_with_valid_config(self, tmp_path):
         """Test initialization with valid configuration."""
-        config = {'base_path': temp_dir}
+        config = {'base_path': str(tmp_path)}
         adapter = LocalStorageAdapter(config)
-        assert adapter._base_path == Path(temp_dir).resolve()
+        assert adapter._base_path.samefile(tmp_path)
     
-    def test_init_creates_directory(self):
+    def test_init_creates_directory(self, tmp_path):
         """Test that initialization creates base directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_path = Path(temp_dir) / 'new_storage'
-            config = {'base_path': str(base_path), 'create_dirs': True}
-            
-            adapter = LocalStorageAdapter(config)
-            assert base_path.exists()
-            assert base_path.is_dir()
-    
-    def test_init_without_create_dirs(self):
+        base_path = tmp_path / 'new_storage'
+        config = {'base_path': str(base_path), 'create_dirs': True}
+        
+        adapter = LocalStorageAdapter(config)
+        assert base_path.exists()
+        assert base_path.is_dir()
+    
+    def test_init_without_create_dirs(self, tmp_path):
         """Test initialization fails if directory doesn't exist and create_dirs=False."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            base_path = Path(temp_dir) / 'nonexistent'
-            config = {'base_path': str(base_path), 'create_dirs': False}
-            
-            with pytest.raises(StorageConnectionError):
-                LocalStorageAdapter(config)
+        base_path = tmp_path / 'nonexistent'
+        config = {'base_path': str(base_path), 'create_dirs': False}
+        
+        with pytest.raises(StorageConnectionError):
+            LocalStorageAdapter(config)
     
     def test_init_missing_base_path(self):
         """Test initialization fails without base_path."""
@@ -68,9 +69,9 @@ class TestLocalAdapterInitialization:
         with pytest.raises(ValueError):
             LocalStorageAdapter({'base_path': ''})
     
-    def test_init_base_path_is_file(self, temp_dir):
+    def test_init_base_path_is_file(self, tmp_path):
         """Test initialization fails if base_path is a file."""
-        file_path = Path(temp_dir) / 'file.txt'
+        file_path = tmp_path / 'file.txt'
         file_path.write_text('test')
         
         with pytest.raises(StorageConnectionError):
@@ -84,10 +85,10 @@ class TestLocalAdapterConnection:
         """Test successful connection test."""
         assert local_adapter.test_connection() is True
     
-    def test_connection_creates_test_file(self, local_adapter, temp_dir):
+    def test_connection_creates_test_file(self, local_adapter, tmp_path):
         """Test that connection test doesn't leave test file."""
         local_adapter.test_connection()
-        test_file = Path(temp_dir) / '.storage_test'
+        test_file = tmp_path / '.storage_test'
         assert not test_file.exists()
 
 
@@ -114,7 +115,7 @@ class TestLocalAdapterUpload:
         assert key == 'subdir/file.txt'
         assert local_adapter.file_exists('subdir/file.txt')
     
-    def test_upload_with_metadata(self, local_adapter, temp_dir):
+    def test_upload_with_metadata(self, local_adapter, tmp_path):
         """Test uploading with metadata."""
         content = b'Data with metadata'
         file_obj = BytesIO(content)
@@ -128,9 +129,21 @@ class TestLocalAdapterUpload:
         )
         
         # Check metadata file was created
-        meta_file = Path(temp_dir) / 'meta_test.txt.meta'
+        meta_file = tmp_path / 'meta_test.txt.meta'
         assert meta_file.exists()
     
+    def test_upload_from_disk_file(self, local_adapter, tmp_path):
+        """Test uploading from a real file copies the remaining bytes."""
+        source = tmp_path / 'source.bin'
+        source.write_bytes(b'header' + bytes(range(256)) * 100)
+        
+        with open(source, 'rb') as f:
+            f.read(6)
+            local_adapter.upload_file(f, 'disk.bin')
+            assert f.read() == b''
+        
+        assert local_adapter.download_file('disk.bin') == bytes(range(256)) * 100
+    
     def test_upload_overwrites_existing(self, local_adapter):
         """Test that upload overwrites existing file."""
         file1 = BytesIO(b'Version 1')
@@ -154,21 +167,17 @@ class TestLocalAdapterDownload:
         downloaded = local_adapter.download_file('download.txt')
         assert downloaded == content
     
-    def test_download_to_destination(self, local_adapter):
+    def test_download_to_destination(self, local_adapter, tmp_path):
         """Test downloading to specific destination."""
         content = b'Destination test'
         local_adapter.upload_file(BytesIO(content), 'dest.txt')
         
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            dest_path = Path(tmp.name)
+        dest_path = tmp_path / 'dest.out'
         
-        try:
-            downloaded = local_adapter.download_file('dest.txt', dest_path)
-            assert downloaded == content
-            assert dest_path.exists()
-            assert dest_path.read_bytes() == content
-        finally:
-            dest_path.unlink(missing_ok=True)
+        downloaded = local_adapter.download_file('dest.txt', dest_path)
+        assert downloaded == content
+        assert dest_path.exists()
+        assert dest_path.read_bytes() == content
     
     def test_download_nonexistent_file(self, local_adapter):
         """Test downloading nonexistent file raises error."""
@@ -188,7 +197,7 @@ class TestLocalAdapterDelete:
         assert result is True
         assert not local_adapter.file_exists('delete.txt')
     
-    def test_delete_with_metadata(self, local_adapter, temp_dir):
+    def test_delete_with_metadata(self, local_adapter, tmp_path):
         """Test deleting file also deletes metadata."""
         local_adapter.upload_file(
             BytesIO(b'With meta'),
@@ -198,13 +207,49 @@ class TestLocalAdapterDelete:
         
         local_adapter.delete_file('with_meta.txt')
         
-        meta_file = Path(temp_dir) / 'with_meta.txt.meta'
+        meta_file = tmp_path / 'with_meta.txt.meta'
         assert not meta_file.exists()
     
     def test_delete_nonexistent_file(self, local_adapter):
         """Test deleting nonexistent file raises error."""
         with pytest.raises(StorageNotFoundError):
             local_adapter.delete_file('nonexistent.txt')
+    
+    def test_delete_files(self, local_adapter):
+        """Test deleting multiple files reports per-key results."""
+        local_adapter.upload_file(BytesIO(b'One'), 'one.txt')
+        local_adapter.upload_file(BytesIO(b'Two'), 'two.txt')
+        
+        results = local_adapter.delete_files(['one.txt', 'two.txt', 'missing.txt'])
+        
+        assert results == {'one.txt': True, 'two.txt': True, 'missing.txt': False}
+        assert not local_adapter.file_exists('one.txt')
+        assert not local_adapter.file_exists('two.txt')
+
+
+class TestLocalAdapterCopy:
+    """Test local adapter file copying."""
+    
+    def test_copy_file(self, local_adapter):
+        """Test copying a file keeps the source and its metadata."""
+        local_adapter.upload_file(
+            BytesIO(b'Copy me'),
+            'source.txt',
+            content_type='text/plain',
+            metadata={'author': 'test'}
+        )
+        
+        key = local_adapter.copy_file('source.txt', 'copies/target.txt')
+        
+        assert key == 'copies/target.txt'
+        assert local_adapter.download_file('copies/target.txt') == b'Copy me'
+        assert local_adapter.get_file_metadata('copies/target.txt').metadata == {'author': 'test'}
+        assert local_adapter.file_exists('source.txt')
+    
+    def test_copy_nonexistent_file(self, local_adapter):
+        """Test copying nonexistent file raises error."""
+        with pytest.raises(StorageNotFoundError):
+            local_adapter.copy_file('nonexistent.txt', 'target.txt')
 
 
 class TestLocalAdapterMetadata:
@@ -222,24 +267,52 @@ class TestLocalAdapterMetadata:
         assert metadata.etag is not None
         assert metadata.last_modified is not None
     
+    def test_get_file_metadata_reads_sidecar(self, local_adapter):
+        """Test metadata stored at upload is returned with file metadata."""
+        local_adapter.upload_file(
+            BytesIO(b'Sidecar'),
+            'sidecar.txt',
+            content_type='text/csv',
+            metadata={'author': 'test'}
+        )
+        
+        metadata = local_adapter.get_file_metadata('sidecar.txt')
+        
+        assert metadata.content_type == 'text/csv'
+        assert metadata.metadata == {'author': 'test'}
+    
     def test_file_exists_true(self, local_adapter):
         """Test file_exists returns True for existing file."""
         local_adapter.upload_file(BytesIO(b'Exists'), 'exists.txt')
         assert local_adapter.file_exists('exists.txt') is True
     
-    def test_file_exists_false(self, local_adapter):
+    def test_file_exists_false(self, session_local_adapter, key_prefix):
         """Test file_exists returns False for nonexistent file."""
-        assert local_adapter.file_exists('nonexistent.txt') is False
+        assert session_local_adapter.file_exists(f'{key_prefix}nonexistent.txt') is False
+    
+    def test_bulk_exists(self, local_adapter):
+        """Test bulk_exists reports each key once."""
+        local_adapter.upload_file(BytesIO(b'Exists'), 'dir/exists.txt')
+        
+        result = local_adapter.bulk_exists(['dir/exists.txt', 'dir/missing.txt', 'dir/exists.txt'])
+        
+        assert result == {'dir/exists.txt': True, 'dir/missing.txt': False}
 
 
 class TestLocalAdapterListing:
     """Test local adapter file listing."""
     
-    def test_list_files(self, local_adapter):
+    @pytest.mark.slow
+    def test_list_files(self, local_adapter, payloads):
         """Test listing files."""
-        # Upload test files
+        # Upload test files through one reused buffer
+        buf = BytesIO()
         for i in range(3):
-            local_adapter.upload_file(BytesIO(f'File {i}'.encode()), f'file{i}.txt')
+            buf.seek(0)
+            buf.truncate()
+            buf.write(payloads[i])
+            buf.seek(0)
+            local_adapter.upload_file(buf, f'file{i}.txt')
         
         files = local_adapter.list_files()
         
@@ -249,6 +322,7 @@ class TestLocalAdapterListing:
         assert 'file1.txt' in keys
         assert 'file2.txt' in keys
     
+    @pytest.mark.slow
     def test_list_files_with_prefix(self, local_adapter):
         """Test listing files with prefix filter."""
         local_adapter.upload_file(BytesIO(b'A'), 'prefix_a.txt')
@@ -263,66 +337,81 @@ class TestLocalAdapterListing:
         assert 'prefix_b.txt' in keys
         assert 'other.txt' not in keys
     
-    def test_list_files_max_results(self, local_adapter):
+    @pytest.mark.slow
+    def test_list_files_max_results(self, local_adapter, payloads):
         """Test listing files respects max_results."""
+        buf = BytesIO()
         for i in range(10):
-            local_adapter.upload_file(BytesIO(f'File {i}'.encode()), f'file{i}.txt')
+            buf.seek(0)
+            buf.truncate()
+            buf.write(payloads[i])
+            buf.seek(0)
+            local_adapter.upload_file(buf, f'file{i}.txt')
         
         files = local_adapter.list_files(max_results=5)
         assert len(files) == 5
     
-    def test_list_empty_directory(self, local_adapter):
+    def test_list_empty_directory(self, session_local_adapter, key_prefix):
         """Test listing empty directory returns empty list."""
-        files = local_adapter.list_files()
+        files = session_local_adapter.list_files(prefix=key_prefix)
         assert files == []
+    
+    def test_list_files_columnar(self, local_adapter):
+        """Test columnar listing matches list_files."""
+        for i in range(3):
+            local_adapter.upload_file(BytesIO(b'x' * i), f'cols/file{i}.txt')
+        
+        columns = local_adapter.list_files_columnar(prefix='cols/')
+        files = local_adapter.list_files(prefix='cols/')
+        
+        assert columns['key'] == [f.key for f in files]
+        assert columns['size'] == [f.size for f in files]
+        assert len(columns['last_modified']) == len(columns['etag']) == 3
 
 
 class TestLocalAdapterPresignedUrl:
     """Test local adapter presigned URL generation."""
     
-    def test_generate_presigned_url(self, local_adapter):
+    def test_generate_presigned_url(self, session_local_adapter, key_prefix):
         """Test generating presigned URL."""
-        local_adapter.upload_file(BytesIO(b'URL test'), 'url_test.txt')
+        key = f'{key_prefix}url_test.txt'
+        session_local_adapter.upload_file(BytesIO(b'URL test'), key)
         
-        presigned = local_adapter.generate_presigned_url('url_test.txt')
+        presigned = session_local_adapter.generate_presigned_url(key)
         
         assert presigned.url.startswith('file://')
         assert presigned.method == 'GET'
         assert presigned.expires_at is not None
     
-    def test_generate_presigned_url_nonexistent(self, local_adapter):
+    def test_generate_presigned_url_nonexistent(self, session_local_adapter, key_prefix):
         """Test generating presigned URL for nonexistent file."""
         with pytest.raises(StorageNotFoundError):
-            local_adapter.generate_presigned_url('nonexistent.txt')
+            session_local_adapter.generate_presigned_url(f'{key_prefix}nonexistent.txt')
     
-    def test_get_public_url(self, local_adapter):
+    def test_get_public_url(self, session_local_adapter, key_prefix):
         """Test getting public URL."""
-        local_adapter.upload_file(BytesIO(b'Public'), 'public.txt')
+        key = f'{key_prefix}public.txt'
+        session_local_adapter.upload_file(BytesIO(b'Public'), key)
         
-        url = local_adapter.get_public_url('public.txt')
+        url = session_local_adapter.get_public_url(key)
         assert url is not None
         assert url.startswith('file://')
     
-    def test_get_public_url_nonexistent(self, local_adapter):
+    def test_get_public_url_nonexistent(self, session_local_adapter, key_prefix):
         """Test getting public URL for nonexistent file."""
-        url = local_adapter.get_public_url('nonexistent.txt')
+        url = session_local_adapter.get_public_url(f'{key_prefix}nonexistent.txt')
         assert url is None
 
 
 class TestLocalAdapterSecurity:
     """Test local adapter security features."""
     
-    def test_path_traversal_prevention(self, local_adapter):
-        """Test that path traversal attacks are prevented."""
-        with pytest.raises(ValueError):
-            local_adapter.upload_file(BytesIO(b'Bad'), '../../../etc/passwd')
-    
-    def test_absolute_path_prevention(self, local_adapter):
-        """Test that absolute paths are prevented."""
-        with pytest.raises(ValueError):
-            local_adapter.upload_file(BytesIO(b'Bad'), '/tmp/malicious.txt')
-    
-    def test_double_dot_prevention(self, local_adapter):
-        """Test that .. in path is prevented."""
+    @pytest.mark.parametrize(
+        "bad_key",
+        ['../../../etc/passwd', '/tmp/malicious.txt', 'subdir/../../../bad.txt'],
+        ids=['path_traversal', 'absolute_path', 'double_dot']
+    )
+    def test_rejects_bad_key(self, session_local_adapter, bad_key):
+        """Test that keys escaping the base directory are rejected before touching disk."""
         with pytest.raises(ValueError):
-            local_adapter.upload_file(BytesIO(b'Bad'), 'subdir/../../../bad.txt')
\ No newline at end of file
+            session_local_adapter.upload_file(BytesIO(b'Bad'), bad_key)
@@ -0,0 +1,222 @@
+"""
+Unit tests for MinIO storage adapter.
+"""
+import gc
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip("minio")
+
+from minio.deleteobjects import DeleteError
+from minio.error import S3Error
+from urllib3 import HTTPResponse
+
+from perceptra_storage import (
+    MinIOStorageAdapter,
+    StorageConnectionError,
+    StorageOperationError,
+    StoragePermissionError,
+)
+from perceptra_storage.adapters import minio as minio_module
+
+pytestmark = pytest.mark.minio
+
+CREDENTIALS = {'access_key': 'minioadmin', 'secret_key': 'minioadmin'}
+
+
+@pytest.fixture
+def minio_adapter():
+    """Create a MinIO adapter; the client never touches the network on init."""
+    def factory(**config):
+        config = dict({'bucket_name': 'my-bucket', 'endpoint_url': 'localhost:9000'}, **config)
+        return MinIOStorageAdapter(config, CREDENTIALS)
+    return factory
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive time.monotonic by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(minio_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def bucket_checks(monkeypatch):
+    """Stub bucket_exists on an adapter and record how often it is called."""
+    def factory(adapter, exists=True):
+        calls = []
+        
+        def bucket_exists(bucket_name):
+            calls.append(bucket_name)
+            return exists
+        
+        monkeypatch.setattr(adapter._client, 'bucket_exists', bucket_exists)
+        return calls
+    return factory
+
+
+def s3_error(code):
+    """Build the S3Error the MinIO client raises for an error response."""
+    return S3Error(HTTPResponse(status=403), code, code, '/my-bucket', 'request-id', 'host-id')
+
+
+def raise_error(error):
+    """Build a client method stub that raises error."""
+    def stub(*args, **kwargs):
+        raise error
+    return stub
+
+
+class TestMinIOAdapterHttpClient:
+    """Test the urllib3 pool manager shared between MinIO adapters."""
+    
+    def test_adapters_share_pool_manager(self, minio_adapter):
+        """Test adapters with the same settings share one pool manager."""
+        first = minio_adapter()
+        second = minio_adapter(bucket_name='other-bucket')
+        
+        assert first._client._http is second._client._http
+        assert minio_adapter(max_pool_connections=3)._client._http is not first._client._http
+    
+    def test_collecting_an_adapter_keeps_shared_pools(self, minio_adapter):
+        """Test garbage-collecting one adapter leaves the shared pools open."""
+        first = minio_adapter()
+        second = minio_adapter()
+        manager = first._client._http
+        manager.connection_from_url('http://localhost:9000')
+        assert len(manager.pools) == 1
+        
+        del second
+        gc.collect()
+        
+        assert len(manager.pools) == 1
+
+
+class TestMinIOAdapterDeleteFiles:
+    """Test bulk deletes of the MinIO adapter."""
+    
+    def test_errors_reported_per_key(self, minio_adapter, monkeypatch):
+        """Test only keys reported as errors map to False."""
+        adapter = minio_adapter()
+        requested = []
+        
+        def remove_objects(bucket_name, delete_object_list):
+            requested.extend(obj.name for obj in delete_object_list)
+            return iter([DeleteError('AccessDenied', 'Access Denied', 'locked', None)])
+        
+        monkeypatch.setattr(adapter._client, 'remove_objects', remove_objects)
+        
+        results = adapter.delete_files(['ok', 'missing', 'locked', 'ok'])
+        
+        assert results == {'ok': True, 'missing': True, 'locked': False}
+        assert requested == ['ok', 'missing', 'locked']
+
+
+class TestMinIOAdapterConnectionCache:
+    """Test reuse of successful test_connection checks."""
+    
+    def test_success_reused_within_ttl(self, minio_adapter, bucket_checks, clock):
+        """Test a successful check is reused until conn_cache_ttl elapses."""
+        adapter = minio_adapter(conn_cache_ttl=30)
+        calls = bucket_checks(adapter)
+        
+        assert adapter.test_connection() is True
+        clock[0] += 29
+        assert adapter.test_connection() is True
+        assert len(calls) == 1
+        
+        clock[0] += 2
+        assert adapter.test_connection() is True
+        assert len(calls) == 2
+    
+    def test_failure_not_cached(self, minio_adapter, bucket_checks, clock):
+        """Test a missing bucket is checked again on every call."""
+        adapter = minio_adapter()
+        calls = bucket_checks(adapter, exists=False)
+        
+        for _ in range(2):
+            with pytest.raises(StorageConnectionError):
+                adapter.test_connection()
+        assert len(calls) == 2
+    
+    @pytest.mark.parametrize("error, expected", [
+        (s3_error('NoSuchBucket'), StorageOperationError),
+        (s3_error('AccessDenied'), StoragePermissionError),
+        (ConnectionResetError('reset'), StorageOperationError),
+    ], ids=['no-such-bucket', 'access-denied', 'transport'])
+    @pytest.mark.parametrize("operation, client_method", [
+        (lambda adapter: adapter.upload_file(BytesIO(b'x'), 'k'), 'put_object'),
+        (lambda adapter: adapter.download_file('k'), 'get_object'),
+    ], ids=['upload', 'download'])
+    def test_reset_by_failed_operation(
+        self, minio_adapter, bucket_checks, clock, monkeypatch, error, expected, operation, client_method
+    ):
+        """Test a failed upload or download forces the next check to hit the bucket."""
+        adapter = minio_adapter()
+        calls = bucket_checks(adapter)
+        adapter.test_connection()
+        monkeypatch.setattr(adapter._client, client_method, raise_error(error))
+        
+        with pytest.raises(expected):
+            operation(adapter)
+        
+        adapter.test_connection()
+        assert len(calls) == 2
+
+
+class TestMinIOAdapterPublicUrls:
+    """Test public and presigned URLs of the MinIO adapter."""
+    
+    @pytest.mark.parametrize("secure, expected", [
+        (True, 'https://localhost:9000/my-bucket/data/file.txt'),
+        (False, 'http://localhost:9000/my-bucket/data/file.txt'),
+    ])
+    def test_scheme_follows_secure(self, minio_adapter, secure, expected):
+        """Test the public URL scheme comes from secure, not the endpoint_url."""
+        adapter = minio_adapter(endpoint_url='http://localhost:9000', secure=secure)
+        assert adapter.get_public_url('data/file.txt') == expected
+    
+    def test_secure_by_default(self, minio_adapter):
+        """Test an http:// endpoint still gives https:// URLs unless secure is False."""
+        adapter = minio_adapter(endpoint_url='http://localhost:9000')
+        assert adapter.get_public_url('k').startswith('https://localhost:9000/')
+    
+    @pytest.mark.parametrize("base_url", ['https://cdn.example.com/assets', 'https://cdn.example.com/assets/'])
+    def test_public_base_url(self, minio_adapter, base_url):
+        """Test public_base_url replaces the endpoint and bucket, with or without a trailing slash."""
+        adapter = minio_adapter(public_base_url=base_url)
+        assert adapter.get_public_url('data/file.txt') == 'https://cdn.example.com/assets/data/file.txt'
+    
+    def test_prefer_public_url_for_get(self, minio_adapter):
+        """Test prefer_public_url returns the unsigned public URL for GET."""
+        adapter = minio_adapter(prefer_public_url=True, public_base_url='https://cdn.example.com')
+        
+        presigned = adapter.generate_presigned_url('data/file.txt', method='get')
+        
+        assert presigned.url == 'https://cdn.example.com/data/file.txt'
+        assert presigned.method == 'GET'
+        assert presigned.expires_at > datetime.now(timezone.utc) + timedelta(days=365)
+    
+    def test_prefer_public_url_still_signs_put(self, minio_adapter):
+        """Test prefer_public_url leaves PUT URLs signed."""
+        adapter = minio_adapter(prefer_public_url=True, region='us-east-1')
+        
+        presigned = adapter.generate_presigned_url('upload.bin', expiration=600, method='PUT')
+        query = parse_qs(urlparse(presigned.url).query)
+        
+        assert presigned.url.startswith('https://localhost:9000/my-bucket/upload.bin?')
+        assert query['X-Amz-Expires'] == ['600']
+        assert 'X-Amz-Signature' in query
+        assert presigned.method == 'PUT'
+    
+    def test_get_signed_by_default(self, minio_adapter):
+        """Test GET URLs are signed unless prefer_public_url is set."""
+        adapter = minio_adapter(region='us-east-1')
+        
+        presigned = adapter.generate_presigned_url('data/file.txt')
+        
+        assert 'X-Amz-Signature' in parse_qs(urlparse(presigned.url).query)
@@ -0,0 +1,624 @@
+"""
+Unit tests for Amazon S3 storage adapter.
+"""
+import pytest
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
+
+boto3 = pytest.importorskip("boto3")
+
+from botocore.exceptions import ClientError
+from io import BytesIO
+
+from perceptra_storage import S3StorageAdapter, StorageNotFoundError, StorageOperationError
+from perceptra_storage.adapters import s3 as s3_module
+
+pytestmark = pytest.mark.s3
+
+CREDENTIALS = {'access_key_id': 'AKIDEXAMPLE', 'secret_access_key': 'wJalr/XUtnFEMI+K7MDENG'}
+SESSION_CREDENTIALS = dict(CREDENTIALS, session_token='FwoGZX/IvYXdzE+Lx==')
+
+PRESIGN_OPERATIONS = [('GET', 'get_object'), ('PUT', 'put_object'), ('DELETE', 'delete_object')]
+PRESIGN_KEYS = [
+    'plain.txt',
+    'with space/file name.txt',
+    'ünïcödé/日本.bin',
+    '/leading//double/slash',
+    "reserved+~*'!()&=?#%20.txt",
+]
+
+
+@pytest.fixture(autouse=True)
+def isolated_aws_env(monkeypatch, tmp_path):
+    """Keep the developer's AWS environment and shared clients out of the tests."""
+    for name in ('AWS_ENDPOINT_URL', 'AWS_ENDPOINT_URL_S3', 'AWS_PROFILE'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('AWS_CONFIG_FILE', str(tmp_path / 'aws-config'))
+    monkeypatch.setenv('AWS_SHARED_CREDENTIALS_FILE', str(tmp_path / 'aws-credentials'))
+    # boto3 reads config files once per default session
+    monkeypatch.setattr(boto3, 'DEFAULT_SESSION', None)
+    s3_module._CLIENT_CACHE.clear()
+    yield
+    s3_module._CLIENT_CACHE.clear()
+
+
+@pytest.fixture
+def mock_s3():
+    """Run the test against moto's in-memory S3."""
+    moto = pytest.importorskip("moto")
+    # moto 5 merged the per-service decorators into mock_aws
+    mock = getattr(moto, 'mock_aws', None) or moto.mock_s3
+    with mock():
+        yield
+
+
+@pytest.fixture
+def s3_adapter(mock_s3):
+    """Create an S3 adapter against a fresh mocked bucket."""
+    def factory(**config):
+        adapter = S3StorageAdapter(dict({'bucket_name': 'test-bucket'}, **config), CREDENTIALS)
+        try:
+            adapter._client.create_bucket(Bucket='test-bucket')
+        except adapter._client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+        return adapter
+    return factory
+
+
+@pytest.fixture
+def count_calls(monkeypatch):
+    """Count calls to the named client operations of an adapter."""
+    def factory(adapter, *operations):
+        calls = {operation: 0 for operation in operations}
+        for operation in operations:
+            original = getattr(adapter._client, operation)
+            
+            def counting(*args, _operation=operation, _original=original, **kwargs):
+                calls[_operation] += 1
+                return _original(*args, **kwargs)
+            
+            monkeypatch.setattr(adapter._client, operation, counting)
+        return calls
+    return factory
+
+
+def put_keys(adapter, keys):
+    """Create empty objects directly through the client."""
+    for key in keys:
+        adapter._client.put_object(Bucket='test-bucket', Key=key, Body=b'')
+
+
+class TestS3AdapterLocalPresign:
+    """Test the in-process SigV4 presigner against botocore."""
+    
+    @pytest.mark.parametrize("region", ['us-east-1', 'eu-west-1', 'ap-southeast-2'])
+    @pytest.mark.parametrize("credentials", [CREDENTIALS, SESSION_CREDENTIALS], ids=['static', 'session'])
+    def test_matches_botocore(self, region, credentials):
+        """Test _presign_v4 output is identical to botocore's at the same timestamp."""
+        config = {'bucket_name': 'my-bucket', 'region': region, 'signature_version': 's3v4'}
+        adapter = S3StorageAdapter(config, credentials)
+        assert adapter._presign_locally
+        
+        for method, operation in PRESIGN_OPERATIONS:
+            for key in PRESIGN_KEYS:
+                expected = adapter._client.generate_presigned_url(
+                    operation, Params={'Bucket': 'my-bucket', 'Key': key}, ExpiresIn=900
+                )
+                amz_date = parse_qs(urlparse(expected).query)['X-Amz-Date'][0]
+                now = datetime.strptime(amz_date, '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc)
+                
+                assert adapter._presign_v4(key, method, 900, now) == expected, (method, key)
+    
+    def test_endpoint_override_uses_botocore(self, monkeypatch):
+        """Test AWS_ENDPOINT_URL keeps presigning on botocore's endpoint."""
+        monkeypatch.setenv('AWS_ENDPOINT_URL', 'http://localhost:4566')
+        config = {'bucket_name': 'my-bucket', 'signature_version': 's3v4'}
+        adapter = S3StorageAdapter(config, CREDENTIALS)
+        
+        assert not adapter._presign_locally
+        assert adapter.generate_presigned_url('k').url.startswith('http://localhost:4566/my-bucket/k?')
+    
+    def test_path_addressing_in_config_file_uses_botocore(self, tmp_path):
+        """Test an s3 addressing_style in the AWS config file disables the local signer."""
+        (tmp_path / 'aws-config').write_text('[default]\ns3 =\n  addressing_style = path\n')
+        config = {'bucket_name': 'my-bucket', 'signature_version': 's3v4'}
+        adapter = S3StorageAdapter(config, CREDENTIALS)
+        
+        assert not adapter._presign_locally
+    
+    def test_default_signature_version_uses_botocore(self):
+        """Test the local signer is opt-in."""
+        adapter = S3StorageAdapter({'bucket_name': 'my-bucket'}, CREDENTIALS)
+        assert not adapter._presign_locally
+
+
+@pytest.fixture
+def presign_adapter():
+    """Create an S3 adapter for presigning; no bucket or mock is needed."""
+    def factory(**config):
+        return S3StorageAdapter(dict({'bucket_name': 'my-bucket'}, **config), CREDENTIALS)
+    return factory
+
+
+class TestS3AdapterPresignCache:
+    """Test reuse of recently generated presigned URLs."""
+    
+    def test_reuses_url_with_fresh_instance(self, presign_adapter, count_calls):
+        """Test a cache hit returns the same URL in a new, independent object."""
+        adapter = presign_adapter()
+        calls = count_calls(adapter, 'generate_presigned_url')
+        
+        first = adapter.generate_presigned_url('k')
+        first.url = 'mutated by caller'
+        second = adapter.generate_presigned_url('k')
+        
+        assert calls['generate_presigned_url'] == 1
+        assert second is not first
+        assert second.url != 'mutated by caller'
+        assert second.expires_at == first.expires_at
+    
+    def test_method_and_expiration_are_part_of_the_key(self, presign_adapter, count_calls):
+        """Test different methods and expirations are signed separately."""
+        adapter = presign_adapter()
+        calls = count_calls(adapter, 'generate_presigned_url')
+        
+        adapter.generate_presigned_url('k')
+        adapter.generate_presigned_url('k', method='PUT')
+        adapter.generate_presigned_url('k', expiration=7200)
+        
+        assert calls['generate_presigned_url'] == 3
+    
+    def test_reuse_capped_at_tenth_of_expiration(self, presign_adapter, count_calls, monkeypatch):
+        """Test a URL is not reused for longer than expiration // 10 seconds."""
+        adapter = presign_adapter(presign_cache_ttl=60)
+        calls = count_calls(adapter, 'generate_presigned_url')
+        clock = [1000.0]
+        monkeypatch.setattr(s3_module.time, 'monotonic', lambda: clock[0])
+        
+        adapter.generate_presigned_url('k', expiration=100)
+        clock[0] += 9
+        adapter.generate_presigned_url('k', expiration=100)
+        assert calls['generate_presigned_url'] == 1
+        
+        clock[0] += 2
+        adapter.generate_presigned_url('k', expiration=100)
+        assert calls['generate_presigned_url'] == 2
+    
+    def test_short_expiration_is_never_cached(self, presign_adapter, count_calls):
+        """Test URLs living under ten seconds are always freshly signed."""
+        adapter = presign_adapter()
+        calls = count_calls(adapter, 'generate_presigned_url')
+        
+        adapter.generate_presigned_url('k', expiration=5)
+        adapter.generate_presigned_url('k', expiration=5)
+        
+        assert calls['generate_presigned_url'] == 2
+    
+    def test_cache_disabled(self, presign_adapter, count_calls):
+        """Test presign_cache_size=0 signs every call."""
+        adapter = presign_adapter(presign_cache_size=0)
+        calls = count_calls(adapter, 'generate_presigned_url')
+        
+        adapter.generate_presigned_url('k')
+        adapter.generate_presigned_url('k')
+        
+        assert calls['generate_presigned_url'] == 2
+        assert not adapter._presign_cache
+
+
+class TestS3AdapterBulkExists:
+    """Test LIST-based bulk existence checks."""
+    
+    def test_directory_answered_from_one_listing(self, s3_adapter, count_calls):
+        """Test keys sharing a directory are resolved by a single LIST."""
+        adapter = s3_adapter()
+        put_keys(adapter, ['img/a.jpg', 'img/b.jpg', 'img/d.jpg'])
+        calls = count_calls(adapter, 'list_objects_v2', 'head_object')
+        
+        result = adapter.bulk_exists(['img/a.jpg', 'img/c.jpg', 'img/d.jpg', 'img/a.jpg'])
+        
+        assert result == {'img/a.jpg': True, 'img/c.jpg': False, 'img/d.jpg': True}
+        assert calls == {'list_objects_v2': 1, 'head_object': 0}
+    
+    def test_keys_past_last_listed_key(self, s3_adapter, count_calls):
+        """Test keys sorting after everything in the listing resolve as missing without HEAD."""
+        adapter = s3_adapter()
+        put_keys(adapter, ['docs/a.txt', 'docs/b.txt'])
+        calls = count_calls(adapter, 'list_objects_v2', 'head_object')
+        
+        result = adapter.bulk_exists(['docs/a.txt', 'docs/y.txt', 'docs/z.txt'])
+        
+        assert result == {'docs/a.txt': True, 'docs/y.txt': False, 'docs/z.txt': False}
+        assert calls == {'list_objects_v2': 1, 'head_object': 0}
+    
+    def test_singleton_directory_uses_head(self, s3_adapter, count_calls):
+        """Test a key alone in its directory is checked with HeadObject."""
+        adapter = s3_adapter()
+        put_keys(adapter, ['solo/x.txt'])
+        calls = count_calls(adapter, 'list_objects_v2', 'head_object')
+        
+        result = adapter.bulk_exists(['solo/x.txt', 'other/y.txt'])
+        
+        assert result == {'solo/x.txt': True, 'other/y.txt': False}
+        assert calls == {'list_objects_v2': 0, 'head_object': 2}
+    
+    @pytest.mark.slow
+    def test_dense_directory_falls_back_to_head(self, s3_adapter, count_calls):
+        """Test the page budget stops the scan and leaves unreached keys to HEAD."""
+        adapter = s3_adapter()
+        put_keys(adapter, [f'dense/{i:04d}' for i in range(1100)])
+        calls = count_calls(adapter, 'list_objects_v2', 'head_object')
+        
+        # Two keys allow one page, which ends at dense/0999
+        result = adapter.bulk_exists(['dense/0000', 'dense/1050'])
+        
+        assert result == {'dense/0000': True, 'dense/1050': True}
+        assert calls == {'list_objects_v2': 1, 'head_object': 1}
+
+
+class TestS3AdapterExistsCache:
+    """Test the opt-in existence cache."""
+    
+    def test_disabled_by_default(self, s3_adapter, count_calls):
+        """Test file_exists asks S3 every time without exists_cache_ttl."""
+        adapter = s3_adapter()
+        calls = count_calls(adapter, 'head_object')
+        
+        adapter.file_exists('k')
+        adapter.file_exists('k')
+        
+        assert calls['head_object'] == 2
+    
+    def test_answers_are_cached(self, s3_adapter, count_calls):
+        """Test repeated checks are served from the cache."""
+        adapter = s3_adapter(exists_cache_ttl=60)
+        calls = count_calls(adapter, 'head_object')
+        
+        assert adapter.file_exists('k') is False
+        assert adapter.file_exists('k') is False
+        assert adapter.bulk_exists(['k']) == {'k': False}
+        
+        assert calls['head_object'] == 1
+    
+    def test_invalidated_by_writes(self, s3_adapter):
+        """Test upload_file, delete_file and delete_files drop cached answers."""
+        adapter = s3_adapter(exists_cache_ttl=60)
+        
+        assert adapter.file_exists('k') is False
+        adapter.upload_file(BytesIO(b'data'), 'k')
+        assert adapter.file_exists('k') is True
+        
+        adapter.delete_file('k')
+        assert adapter.file_exists('k') is False
+        
+        adapter.upload_file(BytesIO(b'data'), 'k')
+        assert adapter.bulk_exists(['k']) == {'k': True}
+        adapter.delete_files(['k'])
+        assert adapter.bulk_exists(['k']) == {'k': False}
+
+
+@pytest.fixture
+def small_pages(monkeypatch):
+    """Cap ListObjectsV2 pages at two keys so paging is cheap to exercise."""
+    def factory(adapter):
+        original = adapter._client.list_objects_v2
+        
+        def list_objects_v2(**kwargs):
+            kwargs['MaxKeys'] = min(kwargs.get('MaxKeys', 1000), 2)
+            return original(**kwargs)
+        
+        monkeypatch.setattr(adapter._client, 'list_objects_v2', list_objects_v2)
+    return factory
+
+
+@pytest.fixture
+def executors(monkeypatch):
+    """Record the prefetch executors created by the adapter."""
+    created = []
+    
+    class RecordingExecutor(s3_module.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+    
+    monkeypatch.setattr(s3_module, 'ThreadPoolExecutor', RecordingExecutor)
+    return created
+
+
+class TestS3AdapterListPaging:
+    """Test paged listing of the S3 adapter."""
+    
+    def test_single_page_fetched_inline(self, s3_adapter, count_calls, executors):
+        """Test an untruncated listing makes one request and starts no thread."""
+        adapter = s3_adapter()
+        put_keys(adapter, [f'dir/{i}' for i in range(5)])
+        calls = count_calls(adapter, 'list_objects_v2')
+        
+        assert len(list(adapter.iter_files('dir/'))) == 5
+        assert calls['list_objects_v2'] == 1
+        assert executors == []
+    
+    def test_max_results_zero(self, s3_adapter, count_calls):
+        """Test max_results=0 returns nothing without a request."""
+        adapter = s3_adapter()
+        put_keys(adapter, ['a', 'b'])
+        calls = count_calls(adapter, 'list_objects_v2')
+        
+        assert list(adapter.iter_files(max_results=0)) == []
+        assert adapter.list_files(max_results=0) == []
+        assert calls['list_objects_v2'] == 0
+    
+    def test_max_results_across_pages(self, s3_adapter, small_pages, count_calls):
+        """Test max_results stops paging once enough keys were listed."""
+        adapter = s3_adapter()
+        keys = [f'dir/{i:02d}' for i in range(10)]
+        put_keys(adapter, keys)
+        small_pages(adapter)
+        calls = count_calls(adapter, 'list_objects_v2')
+        
+        assert [obj.key for obj in adapter.iter_files('dir/', max_results=5)] == keys[:5]
+        assert calls['list_objects_v2'] == 3
+        assert [obj.key for obj in adapter.iter_files('dir/')] == keys
+    
+    def test_closing_iterator_early(self, s3_adapter, small_pages, executors):
+        """Test abandoning iter_files shuts down the prefetch thread."""
+        adapter = s3_adapter()
+        put_keys(adapter, [f'dir/{i}' for i in range(10)])
+        small_pages(adapter)
+        
+        iterator = adapter.iter_files('dir/')
+        next(iterator)
+        assert len(executors) == 1
+        
+        iterator.close()
+        assert executors[0]._shutdown
+    
+    @pytest.mark.slow
+    def test_max_results_across_full_pages(self, s3_adapter):
+        """Test max_results against real 1000-key pages."""
+        adapter = s3_adapter()
+        put_keys(adapter, [f'dir/{i:04d}' for i in range(2500)])
+        
+        files = adapter.list_files('dir/', max_results=2300)
+        
+        assert len(files) == 2300
+        assert files[-1].key == 'dir/2299'
+        assert len(adapter.list_files_columnar('dir/', max_results=None)['key']) == 2500
+
+
+class TestS3AdapterCopy:
+    """Test server-side copies of the S3 adapter."""
+    
+    def test_copy_file(self, s3_adapter, count_calls):
+        """Test copying within the bucket uses a single CopyObject."""
+        adapter = s3_adapter()
+        adapter.upload_file(BytesIO(b'Copy me'), 'src.txt')
+        calls = count_calls(adapter, 'copy_object', 'copy')
+        
+        assert adapter.copy_file('src.txt', 'dst.txt') == 'dst.txt'
+        assert adapter.download_file('dst.txt') == b'Copy me'
+        assert calls == {'copy_object': 1, 'copy': 0}
+    
+    def test_copy_from_other_bucket(self, s3_adapter):
+        """Test copying from another bucket."""
+        adapter = s3_adapter()
+        adapter._client.create_bucket(Bucket='other-bucket')
+        adapter._client.put_object(Bucket='other-bucket', Key='src.txt', Body=b'Elsewhere')
+        
+        adapter.copy_file('src.txt', 'dst.txt', src_bucket='other-bucket')
+        assert adapter.download_file('dst.txt') == b'Elsewhere'
+    
+    def test_missing_source_raises_not_found(self, s3_adapter):
+        """Test copying a missing source raises StorageNotFoundError."""
+        adapter = s3_adapter()
+        with pytest.raises(StorageNotFoundError):
+            adapter.copy_file('missing.txt', 'dst.txt')
+    
+    def test_other_invalid_request_is_not_retried(self, s3_adapter, count_calls):
+        """Test an InvalidRequest unrelated to size is raised, not retried as multipart."""
+        adapter = s3_adapter()
+        adapter.upload_file(BytesIO(b'Same'), 'same.txt')
+        calls = count_calls(adapter, 'copy')
+        
+        # Copying an object onto itself without changes is an InvalidRequest
+        with pytest.raises(StorageOperationError):
+            adapter.copy_file('same.txt', 'same.txt')
+        assert calls['copy'] == 0
+    
+    def test_oversized_source_falls_back_to_multipart(self, s3_adapter, count_calls, monkeypatch):
+        """Test a source over the CopyObject limit is copied with the managed transfer."""
+        adapter = s3_adapter()
+        adapter.upload_file(BytesIO(b'Large'), 'large.bin')
+        
+        original = adapter._client.copy_object
+        attempts = []
+        
+        def copy_object(**kwargs):
+            # Only the adapter's single-request attempt fails; s3transfer
+            # copies a source this small with CopyObject too
+            attempts.append(kwargs)
+            if len(attempts) > 1:
+                return original(**kwargs)
+            raise ClientError(
+                {'Error': {
+                    'Code': 'InvalidRequest',
+                    'Message': 'The specified copy source is larger than the maximum '
+                               'allowable size for a copy source: 5368709120'
+                }},
+                'CopyObject'
+            )
+        
+        monkeypatch.setattr(adapter._client, 'copy_object', copy_object)
+        calls = count_calls(adapter, 'copy')
+        
+        adapter.copy_file('large.bin', 'large-copy.bin')
+        assert calls['copy'] == 1
+        assert adapter.download_file('large-copy.bin') == b'Large'
+
+
+class TestS3AdapterDeleteFiles:
+    """Test bulk deletes of the S3 adapter."""
+    
+    def test_missing_keys_reported_as_deleted(self, s3_adapter):
+        """Test deleted and missing keys both map to True."""
+        adapter = s3_adapter()
+        put_keys(adapter, ['k'])
+        
+        assert adapter.delete_files(['k', 'missing', 'k']) == {'k': True, 'missing': True}
+        assert adapter.file_exists('k') is False
+    
+    def test_batches_requests(self, s3_adapter, count_calls, monkeypatch):
+        """Test keys are split into DeleteObjects batches."""
+        adapter = s3_adapter()
+        keys = [f'batch/{i}' for i in range(5)]
+        put_keys(adapter, keys)
+        monkeypatch.setattr(s3_module, '_DELETE_BATCH_SIZE', 2)
+        calls = count_calls(adapter, 'delete_objects')
+        
+        assert adapter.delete_files(keys) == dict.fromkeys(keys, True)
+        assert calls['delete_objects'] == 3
+        assert adapter.list_files('batch/') == []
+    
+    def test_errors_reported_per_key(self, s3_adapter, monkeypatch):
+        """Test keys in the Errors of a response map to False."""
+        adapter = s3_adapter()
+        
+        def delete_objects(**kwargs):
+            return {'Errors': [{'Key': 'locked', 'Code': 'AccessDenied'}]}
+        
+        monkeypatch.setattr(adapter._client, 'delete_objects', delete_objects)
+        
+        assert adapter.delete_files(['ok', 'locked']) == {'ok': True, 'locked': False}
+
+
+class TestS3AdapterDownload:
+    """Test downloads of the S3 adapter."""
+    
+    def test_small_object_single_request(self, s3_adapter, count_calls):
+        """Test an object under the multipart threshold takes one GetObject."""
+        adapter = s3_adapter()
+        adapter.upload_file(BytesIO(b'ab'), 'small.txt')
+        calls = count_calls(adapter, 'get_object', 'head_object', 'download_fileobj')
+        
+        assert adapter.download_file('small.txt') == b'ab'
+        assert calls == {'get_object': 1, 'head_object': 0, 'download_fileobj': 0}
+    
+    def test_empty_object(self, s3_adapter):
+        """Test downloading an empty object."""
+        adapter = s3_adapter()
+        adapter.upload_file(BytesIO(b''), 'empty.txt')
+        
+        assert adapter.download_file('empty.txt') == b''
+    
+    def test_large_object_uses_managed_download(self, s3_adapter, count_calls):
+        """Test an object over the multipart threshold is handed to the managed transfer."""
+        adapter = s3_adapter(s3_multipart_chunksize=5 * 1024 * 1024, s3_multipart_threshold=1024)
+        payload = bytes(range(256)) * 64
+        adapter.upload_file(BytesIO(payload), 'large.bin')
+        calls = count_calls(adapter, 'download_fileobj')
+        
+        assert adapter.download_file('large.bin') == payload
+        assert calls['download_fileobj'] == 1
+    
+    def test_missing_key_raises_not_found(self, s3_adapter):
+        """Test downloading a missing key raises StorageNotFoundError."""
+        adapter = s3_adapter()
+        with pytest.raises(StorageNotFoundError):
+            adapter.download_file('missing.txt')
+    
+    @pytest.mark.parametrize("size", [2, 16384], ids=['small', 'managed'])
+    def test_download_to_destination(self, s3_adapter, tmp_path, size):
+        """Test downloading writes the file to the destination and returns its bytes."""
+        adapter = s3_adapter(s3_multipart_threshold=1024)
+        payload = bytes(range(256)) * (size // 256) or b'ab'
+        adapter.upload_file(BytesIO(payload), 'dest.bin')
+        dest_path = tmp_path / 'dest'
+        
+        assert adapter.download_file('dest.bin', dest_path) == payload
+        assert dest_path.read_bytes() == payload
+
+
+class TestS3AdapterListMetadata:
+    """Test listing with and without per-file metadata."""
+    
+    def test_metadata_not_fetched_by_default(self, s3_adapter, count_calls):
+        """Test the default listing leaves content type and metadata unset."""
+        adapter = s3_adapter()
+        adapter.upload_file(BytesIO(b'x'), 'meta/a.txt', content_type='text/plain', metadata={'k': 'v'})
+        calls = count_calls(adapter, 'head_object')
+        
+        [obj] = adapter.list_files('meta/')
+        
+        assert obj.content_type is None
+        assert obj.metadata is None
+        assert calls['head_object'] == 0
+    
+    def test_fetch_metadata(self, s3_adapter):
+        """Test fetch_metadata populates content type and user metadata in listing order."""
+        adapter = s3_adapter()
+        adapter.upload_file(BytesIO(b'a'), 'meta/a.txt', content_type='text/plain', metadata={'k': 'a'})
+        adapter.upload_file(BytesIO(b'bb'), 'meta/b.json', content_type='application/json', metadata={'k': 'b'})
+        
+        files = adapter.list_files('meta/', fetch_metadata=True)
+        
+        assert [(f.key, f.size, f.content_type, f.metadata) for f in files] == [
+            ('meta/a.txt', 1, 'text/plain', {'k': 'a'}),
+            ('meta/b.json', 2, 'application/json', {'k': 'b'}),
+        ]
+    
+    def test_file_deleted_after_listing_is_skipped(self, s3_adapter, monkeypatch):
+        """Test a file removed between the listing and its HeadObject is left out."""
+        adapter = s3_adapter()
+        put_keys(adapter, ['meta/a', 'meta/gone', 'meta/c'])
+        original = adapter._client.head_object
+        
+        def head_object(**kwargs):
+            if kwargs['Key'] == 'meta/gone':
+                adapter._client.delete_object(Bucket='test-bucket', Key='meta/gone')
+            return original(**kwargs)
+        
+        monkeypatch.setattr(adapter._client, 'head_object', head_object)
+        
+        assert [f.key for f in adapter.list_files('meta/', fetch_metadata=True)] == ['meta/a', 'meta/c']
+
+
+class TestS3AdapterClientCache:
+    """Test sharing of boto3 clients between adapters."""
+    
+    def test_same_settings_share_client(self):
+        """Test adapters differing only in bucket share one client."""
+        first = S3StorageAdapter({'bucket_name': 'first-bucket'}, CREDENTIALS)
+        second = S3StorageAdapter({'bucket_name': 'second-bucket'}, dict(CREDENTIALS))
+        
+        assert first._client is second._client
+        assert len(s3_module._CLIENT_CACHE) == 1
+    
+    @pytest.mark.parametrize("config, credentials", [
+        ({}, SESSION_CREDENTIALS),
+        ({}, dict(CREDENTIALS, secret_access_key='other-secret')),
+        ({'max_pool_connections': 5}, CREDENTIALS),
+        ({'region': 'eu-west-1'}, CREDENTIALS),
+    ], ids=['session-token', 'secret', 'max-pool-connections', 'region'])
+    def test_different_settings_get_own_client(self, config, credentials):
+        """Test adapters with different credentials or client settings don't share."""
+        base = S3StorageAdapter({'bucket_name': 'my-bucket'}, CREDENTIALS)
+        other = S3StorageAdapter(dict({'bucket_name': 'my-bucket'}, **config), credentials)
+        
+        assert other._client is not base._client
+    
+    def test_least_recently_used_evicted(self, monkeypatch):
+        """Test the cache drops the least recently used client beyond _CLIENT_CACHE_SIZE."""
+        monkeypatch.setattr(s3_module, '_CLIENT_CACHE_SIZE', 2)
+        
+        def adapter(region):
+            return S3StorageAdapter({'bucket_name': 'my-bucket', 'region': region}, CREDENTIALS)
+        
+        first = adapter('us-east-1')
+        second = adapter('us-west-2')
+        # Touch the first client so the second becomes least recently used
+        assert adapter('us-east-1')._client is first._client
+        adapter('eu-west-1')
+        
+        assert len(s3_module._CLIENT_CACHE) == 2
+        assert adapter('us-east-1')._client is first._client
+        assert adapter('us-west-2')._client is not second._client
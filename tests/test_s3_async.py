@@ -0,0 +1,124 @@
+"""
+Unit tests for asynchronous Amazon S3 storage adapter.
+"""
+import pytest
+from io import BytesIO
+from urllib.request import Request, urlopen
+
+pytest.importorskip("aioboto3")
+pytest.importorskip("pytest_asyncio")
+boto3 = pytest.importorskip("boto3")
+moto_server = pytest.importorskip("moto.server")
+
+from perceptra_storage import StorageNotFoundError
+from perceptra_storage.adapters.s3_async import AsyncS3StorageAdapter
+
+pytestmark = [pytest.mark.s3, pytest.mark.asyncio]
+
+BUCKET = 'async-bucket'
+CREDENTIALS = {'access_key_id': 'testing', 'secret_access_key': 'testing'}
+
+
+@pytest.fixture(scope="module")
+def moto_endpoint():
+    """Run moto's S3 as a local HTTP server for the module."""
+    server = moto_server.ThreadedMotoServer(ip_address='127.0.0.1', port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    yield f"http://{host}:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def async_adapter(moto_endpoint, monkeypatch):
+    """Create an async S3 adapter against an empty bucket on the moto server."""
+    urlopen(Request(f"{moto_endpoint}/moto-api/reset", method='POST')).close()
+    monkeypatch.setenv('AWS_ENDPOINT_URL', moto_endpoint)
+    monkeypatch.setattr(boto3, 'DEFAULT_SESSION', None)
+    
+    boto3.client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='testing',
+        aws_secret_access_key='testing'
+    ).create_bucket(Bucket=BUCKET)
+    
+    return AsyncS3StorageAdapter({'bucket_name': BUCKET}, CREDENTIALS)
+
+
+class TestAsyncS3AdapterLifecycle:
+    """Test client lifecycle of the async adapter."""
+    
+    async def test_client_opened_lazily(self, async_adapter):
+        """Test the client is only opened on first use and released by close()."""
+        assert async_adapter._client is None
+        
+        assert await async_adapter.test_connection() is True
+        assert async_adapter._client is not None
+        
+        await async_adapter.close()
+        assert async_adapter._client is None
+    
+    async def test_async_context_manager(self, async_adapter):
+        """Test async with closes the client on exit."""
+        async with async_adapter as adapter:
+            assert await adapter.file_exists('missing.txt') is False
+            assert adapter._client is not None
+        
+        assert async_adapter._client is None
+
+
+class TestAsyncS3AdapterOperations:
+    """Test file operations of the async adapter."""
+    
+    async def test_upload_and_download(self, async_adapter):
+        """Test uploading and downloading a file."""
+        async with async_adapter as adapter:
+            key = await adapter.upload_file(BytesIO(b'Async content'), 'data/file.txt', content_type='text/plain')
+            
+            assert key == 'data/file.txt'
+            assert await adapter.download_file('data/file.txt') == b'Async content'
+            metadata = await adapter.get_file_metadata('data/file.txt')
+            assert metadata.size == len(b'Async content')
+            assert metadata.content_type == 'text/plain'
+    
+    async def test_download_to_destination(self, async_adapter, tmp_path):
+        """Test downloading writes the file to the destination."""
+        dest_path = tmp_path / 'dest.out'
+        
+        async with async_adapter as adapter:
+            await adapter.upload_file(BytesIO(b'Destination test'), 'dest.txt')
+            downloaded = await adapter.download_file('dest.txt', dest_path)
+        
+        assert downloaded == b'Destination test'
+        assert dest_path.read_bytes() == b'Destination test'
+    
+    async def test_list_files_max_results(self, async_adapter):
+        """Test listing respects prefix and max_results."""
+        async with async_adapter as adapter:
+            for i in range(5):
+                await adapter.upload_file(BytesIO(b'x'), f'listing/file{i}.txt')
+            await adapter.upload_file(BytesIO(b'x'), 'other.txt')
+            
+            files = await adapter.list_files(prefix='listing/')
+            limited = await adapter.list_files(prefix='listing/', max_results=3)
+        
+        assert sorted(f.key for f in files) == [f'listing/file{i}.txt' for i in range(5)]
+        assert len(limited) == 3
+    
+    async def test_missing_key_raises_not_found(self, async_adapter):
+        """Test missing keys map to StorageNotFoundError."""
+        async with async_adapter as adapter:
+            with pytest.raises(StorageNotFoundError):
+                await adapter.download_file('missing.txt')
+            with pytest.raises(StorageNotFoundError):
+                await adapter.get_file_metadata('missing.txt')
+    
+    async def test_delete_file(self, async_adapter):
+        """Test deleting a file, including one that no longer exists."""
+        async with async_adapter as adapter:
+            await adapter.upload_file(BytesIO(b'Delete me'), 'delete.txt')
+            
+            assert await adapter.delete_file('delete.txt') is True
+            assert await adapter.file_exists('delete.txt') is False
+            assert await adapter.delete_file('delete.txt') is True